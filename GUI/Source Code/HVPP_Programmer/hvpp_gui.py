@@ -4,116 +4,252 @@ AVR High Voltage Parallel Programmer GUI
 Cross-platform GUI using tkinter (compatible with Windows, Linux x86_64, Linux ARM64)
 """
 
+import concurrent.futures
+import io
+import os
+from functools import partial
 import sys
 import threading
-import json
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 from pathlib import Path
-from typing import Optional, Callable, Union
-from hvpp_programmer import AtmelHighVoltageParallelProgrammer, HVPPCommand
+from typing import Optional, Callable, Hashable, Union
+from hvpp_programmer import (
+    AtmelHighVoltageParallelProgrammer,
+    FirmwareResponseError,
+    HVPPCommand,
+    OperationStoppedError,
+)
 import serial
 
-# Debug messages control variable
-DEBUG_PRINT = False
+# Faster JSON parsers are used when installed (optional)
+try:
+    import orjson as json_parser
+except ImportError:
+    try:
+        import ujson as json_parser
+    except ImportError:
+        import json as json_parser
+
+# tkthread runs Tk calls made from worker threads directly on the Tk thread (optional)
+try:
+    import tkthread
+    tkthread.tkinstall()
+except ImportError:
+    tkthread = None
+
+# Debug messages control variable (also enabled by the HVPP_DEBUG=1 environment variable)
+DEBUG_PRINT = os.environ.get("HVPP_DEBUG", "0") not in ("", "0")
 
 
 class ToolTip:
     """Create a tooltip (info-bubble) for a given widget"""
 
-    def __init__(self, widget, text: Union[str, Callable[[], str]], delay: int = 500):
+    # Only one tooltip is visible at a time: all instances share one window
+    _shared_tip: Optional[tk.Toplevel] = None
+    _shared_label: Optional[tk.Label] = None
+    _shared_owner: Optional["ToolTip"] = None
+    # Instance with a scheduled (not yet displayed) tooltip, at most one at a time
+    _pending: Optional["ToolTip"] = None
+
+    def __init__(
+        self,
+        widget,
+        text: Union[str, Callable[[], str]],
+        delay: int = 500,
+        cache_key: Optional[Callable[[], Hashable]] = None
+    ):
         """
         Args:
             widget: The widget to attach the tooltip to
             text: Text to display in the tooltip (string or callable returning string)
             delay: Delay in milliseconds before showing tooltip
+            cache_key: Optional callable returning the inputs the text depends on;
+                the text callable is only called again when this key changes
         """
         self.widget = widget
         self.text_source = text
         self.delay = delay
-        self.tip_window = None
+        self.cache_key = cache_key
         self.timer_id = None
+        self._last_key: Optional[Hashable] = None
+        self._last_text = ""
 
         # Bind events
         self.widget.bind("<Enter>", self._on_enter)
         self.widget.bind("<Leave>", self._on_leave)
-        self.widget.bind("<Button>", self._on_leave)
 
     def _on_enter(self, event=None):
         """Mouse enters widget - schedule tooltip display"""
-        self._cancel_timer()
+        # Moving quickly across widgets keeps a single scheduled display
+        if ToolTip._pending is not None:
+            ToolTip._pending._cancel_timer()
         self.timer_id = self.widget.after(self.delay, self._show_tip)
+        ToolTip._pending = self
 
     def _on_leave(self, event=None):
-        """Mouse leaves widget or button pressed - hide tooltip"""
+        """Mouse leaves widget - hide tooltip"""
         self._cancel_timer()
         self._hide_tip()
 
     def _cancel_timer(self):
         """Cancel scheduled tooltip display"""
-        if self.timer_id:
-            self.widget.after_cancel(self.timer_id)
+        if self.timer_id is not None:
+            try:
+                self.widget.after_cancel(self.timer_id)
+            except tk.TclError:
+                pass  # Widget already destroyed
             self.timer_id = None
+        if ToolTip._pending is self:
+            ToolTip._pending = None
 
     def _show_tip(self):
         """Display the tooltip"""
-        # Get text (call function if callable)
-        text = self.text_source() if callable(self.text_source) else self.text_source
+        self.timer_id = None
+        if ToolTip._pending is self:
+            ToolTip._pending = None
+
+        # Get text (call function if callable, unless its inputs did not change)
+        if not callable(self.text_source):
+            text = self.text_source
+        elif self.cache_key is None:
+            text = self.text_source()
+        else:
+            key = self.cache_key()
+            if key != self._last_key:
+                self._last_key = key
+                self._last_text = self.text_source()
+            text = self._last_text
 
-        if self.tip_window or not text:
+        if not text:
             return
 
         # Get widget position
         x = self.widget.winfo_rootx() + 20
         y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
 
-        # Create tooltip window
-        self.tip_window = tw = tk.Toplevel(self.widget)
-        tw.wm_overrideredirect(True)  # Remove window decorations
-        tw.wm_geometry(f"+{x}+{y}")
-
-        # Create label with tooltip text
-        label = tk.Label(
-            tw,
-            text=text,
-            justify=tk.LEFT,
-            background="#ffffe0",
-            relief=tk.SOLID,
-            borderwidth=1,
-            font=("Arial", 9, "normal"),
-            padx=4,
-            pady=2
-        )
-        label.pack()
+        # Shared tooltip window created on first use (hidden), then only shown/hidden
+        if ToolTip._shared_tip is None:
+            ToolTip._shared_tip = tw = tk.Toplevel(self.widget.winfo_toplevel())
+            tw.wm_overrideredirect(True)  # Remove window decorations
+            tw.withdraw()
+
+            # Label displaying tooltip text
+            ToolTip._shared_label = tk.Label(
+                tw,
+                justify=tk.LEFT,
+                background="#ffffe0",
+                relief=tk.SOLID,
+                borderwidth=1,
+                font=("Arial", 9, "normal"),
+                padx=4,
+                pady=2
+            )
+            ToolTip._shared_label.pack()
+
+        # Update and show tooltip window
+        ToolTip._shared_owner = self
+        ToolTip._shared_label.config(text=text)
+        ToolTip._shared_tip.wm_geometry(f"+{x}+{y}")
+        ToolTip._shared_tip.deiconify()
 
     def _hide_tip(self):
-        """Hide the tooltip"""
-        if self.tip_window:
-            self.tip_window.destroy()
-            self.tip_window = None
+        """Hide the tooltip (only if currently displayed for this widget)"""
+        if ToolTip._shared_owner is self:
+            ToolTip._shared_tip.withdraw()
+            ToolTip._shared_owner = None
 
 
 class FuseDefinitions:
     """Manage fuse/lock definitions from JSON file"""
 
+    # Maximum number of cached tooltip texts
+    TOOLTIP_CACHE_SIZE = 256
+
+    # Usual spellings of a fuse byte value ("ff", "FF", "0xff", "0xFF") -> int
+    _HEX_BYTE = (
+        {f"{i:02x}": i for i in range(256)}
+        | {f"{i:02X}": i for i in range(256)}
+        | {f"0x{i:02x}": i for i in range(256)}
+        | {f"0x{i:02X}": i for i in range(256)}
+    )
+
     def __init__(self, json_path: Path):
         """
         Args:
             json_path: Path to the fuse definitions JSON file
         """
         self.definitions = {}
-        self._load_definitions(json_path)
+        # (chip, fuse_type) -> [(header, extract_bits, value_lines)], see _prepare_definitions
+        self._prepared: dict[
+            tuple[str, str], list[tuple[str, Callable[[int], int], tuple[Optional[str], ...]]]
+        ] = {}
+        self._tooltip_cache: dict[tuple[str, str, Optional[str]], str] = {}
+        # Definitions are only loaded when the first tooltip is requested
+        self._pending_path: Optional[Path] = json_path
 
     def _load_definitions(self, json_path: Path):
         """Load fuse definitions from JSON file"""
+        self._pending_path = None
+        # Cached tooltips are no longer valid once definitions are reloaded
+        self._tooltip_cache.clear()
         try:
             if json_path.exists():
-                with open(json_path, 'r', encoding='utf-8') as f:
-                    self.definitions = json.load(f)
+                with open(json_path, 'rb') as f:
+                    self.definitions = json_parser.loads(f.read())
         except Exception as e:
             if DEBUG_PRINT:
                 print(f"Error loading fuse definitions: {e}")
             self.definitions = {}
+        self._prepare_definitions()
+
+    def _prepare_definitions(self):
+        """Precompute the static part of every tooltip (headers and value lines)
+
+        For each bit group, extract_bits returns the group value from the fuse
+        byte and value_lines holds one entry per possible value: the formatted
+        line without highlight, or None for a reserved value.
+        """
+        self._prepared = {}
+        for chip, fuses in self.definitions.items():
+            for fuse_type, fuse_groups in fuses.items():
+                # A malformed entry only loses its own tooltip
+                try:
+                    self._prepared[(chip, fuse_type)] = self._prepare_groups(fuse_groups)
+                except (KeyError, IndexError, TypeError, AttributeError) as e:
+                    if DEBUG_PRINT:
+                        print(f"Invalid fuse definitions for {chip} {fuse_type}: {e}")
+
+    def _prepare_groups(
+        self, fuse_groups: list
+    ) -> list[tuple[str, Callable[[int], int], tuple[Optional[str], ...]]]:
+        """Precompute the tooltip part of each bit group of one fuse/lock byte"""
+        prepared_groups = []
+        for group in fuse_groups:
+            bits = group["bits"]
+            label = group.get("label", "")
+            values = group.get("values", {})
+
+            # Format bit range
+            if len(bits) == 1:
+                bit_range = f"Bit {bits[0]}"
+            else:
+                bit_range = f"Bits {bits[0]}-{bits[-1]}"
+
+            # Group header
+            if label:
+                header = f"═══ {bit_range}: {label} ═══"
+            else:
+                header = f"═══ {bit_range} ═══"
+
+            # Get max value for this bit group
+            max_value = (1 << len(bits)) - 1
+            value_lines = tuple(
+                f"    {i}: {values[str(i)]}" if str(i) in values else None
+                for i in range(max_value + 1)
+            )
+            prepared_groups.append((header, self._make_bits_extractor(bits), value_lines))
+        return prepared_groups
 
     def get_fuse_tooltip(self, chip: str, fuse_type: str, current_value: Optional[str] = None) -> str:
         """
@@ -127,76 +263,83 @@ class FuseDefinitions:
         Returns:
             Formatted tooltip text or empty string if no definition available
         """
-        # Check if chip exists in definitions
-        if chip not in self.definitions:
-            return ""
-
-        # Check if fuse type exists for this chip
-        if fuse_type not in self.definitions[chip]:
+        if self._pending_path is not None:
+            self._load_definitions(self._pending_path)
+
+        # Tooltip text only depends on its arguments, reuse it on repeated hovers
+        key = (chip, fuse_type, current_value)
+        text = self._tooltip_cache.get(key)
+        if text is None:
+            if len(self._tooltip_cache) >= self.TOOLTIP_CACHE_SIZE:
+                self._tooltip_cache.clear()
+            text = self._build_tooltip(chip, fuse_type, current_value)
+            self._tooltip_cache[key] = text
+        return text
+
+    def _build_tooltip(self, chip: str, fuse_type: str, current_value: Optional[str]) -> str:
+        """Build tooltip text for a fuse/lock byte (see get_fuse_tooltip)"""
+        # Check if chip and fuse type exist in definitions
+        fuse_groups = self._prepared.get((chip, fuse_type))
+        if fuse_groups is None:
             return ""
 
         # Parse current value if provided
         current_byte = None
         if current_value:
             try:
-                # Remove "0x" prefix if present and convert to int
                 val_str = current_value.strip()
-                if val_str.lower().startswith("0x"):
-                    current_byte = int(val_str, 16)
-                else:
+                current_byte = self._HEX_BYTE.get(val_str)
+                if current_byte is None:
+                    # Less common spelling (e.g. "0XFF", "f"), "0x" prefix accepted by int()
                     current_byte = int(val_str, 16)
             except (ValueError, AttributeError):
                 current_byte = None
 
-        # Build tooltip text
-        lines = []
-        fuse_groups = self.definitions[chip][fuse_type]
-
-        for group in fuse_groups:
-            bits = group["bits"]
-            label = group.get("label", "")
-            values = group.get("values", {})
-
-            # Format bit range
-            if len(bits) == 1:
-                bit_range = f"Bit {bits[0]}"
-            else:
-                bit_range = f"Bits {bits[0]}-{bits[-1]}"
-
-            # Add group header
-            if label:
-                lines.append(f"═══ {bit_range}: {label} ═══")
-            else:
-                lines.append(f"═══ {bit_range} ═══")
+        # Build tooltip text from the prepared lines, only the arrow depends on the value
+        buf = io.StringIO()
+        write = buf.write
+        for header, extract_bits, value_lines in fuse_groups:
+            write(header)
+            write("\n")
 
             # Extract current value for this bit group
             current_group_value = None
             if current_byte is not None:
-                current_group_value = self._extract_bits(current_byte, bits)
+                current_group_value = extract_bits(current_byte)
 
-            # Add values
-            # Get max value for this bit group
-            max_value = (1 << len(bits)) - 1
+            for i, line in enumerate(value_lines):
+                if current_group_value == i:
+                    # Highlight current value (reserved values are only shown when current)
+                    write(f"  → {line[4:]}\n" if line else f"  → {i}: Réservé\n")
+                elif line:
+                    write(line)
+                    write("\n")
 
-            for i in range(max_value + 1):
-                value_str = str(i)
-                if value_str in values:
-                    label_text = values[value_str]
-                    # Highlight current value
-                    if current_group_value == i:
-                        lines.append(f"  → {i}: {label_text}")
-                    else:
-                        lines.append(f"    {i}: {label_text}")
-                else:
-                    # Only show reserved if it's the current value
-                    if current_group_value == i:
-                        lines.append(f"  → {i}: Réservé")
+            write("\n")  # Empty line between groups
+
+        return buf.getvalue().rstrip()
+
+    @classmethod
+    def _make_bits_extractor(cls, bits: list) -> Callable[[int], int]:
+        """
+        Build a function extracting a bit group from a byte value
 
-            lines.append("")  # Empty line between groups
+        Args:
+            bits: List of bit positions (0-7, from LSB to MSB)
+
+        Returns:
+            Function taking the byte value and returning the extracted value
+        """
+        if bits == list(range(bits[0], bits[0] + len(bits))):
+            # Contiguous bits: a single shift and mask
+            shift = bits[0]
+            mask = (1 << len(bits)) - 1
+            return lambda byte_value: (byte_value >> shift) & mask
 
-        return "\n".join(lines).rstrip()
+        return lambda byte_value: cls._extract_bits(byte_value, bits)
 
-    def _extract_bits(self, byte_value: int, bits: list) -> int:
+    @staticmethod
+    def _extract_bits(byte_value: int, bits: list) -> int:
         """
         Extract specific bits from a byte value
 
@@ -217,18 +360,31 @@ class FuseDefinitions:
 class HVPPConfiguratorGUI:
     """Main GUI application for HVPP Configurator"""
 
+    # Period (ms) of the progress bar refresh during memory operations (~60 Hz)
+    PROGRESS_POLL_MS = 16
+
+    # Size (characters) of the pieces the programmer log is inserted by
+    LOG_INSERT_CHUNK = 4096
+
     # Available chip types
-    CHIP_TYPES = [
+    CHIP_TYPES = (
         "ATMEGA8(A)(L)",
         "ATMEGA48",
         "ATMEGA168(P)(PA)",
         "ATMEGA328(P)",
         "ATTINY2313(V)",
         "ATMEGA1284(P)"
-    ]
+    )
 
-    @staticmethod
-    def _parse_programmer_response(response: str) -> tuple[bool, str]:
+    # Parsed value of the exact programmer responses (see _parse_programmer_response)
+    _FAST_RESPONSES = {
+        "": (False, ""),
+        "0": (True, ""),
+        "1": (False, ""),
+    }
+
+    @classmethod
+    def _parse_programmer_response(cls, response: str) -> tuple[bool, str]:
         """
         Parse programmer response to check success/failure and extract error message
 
@@ -242,19 +398,14 @@ class HVPPConfiguratorGUI:
             - If response is "1" alone, returns (False, "")
             - Otherwise returns (False, "")
         """
-        if not response:
-            return (False, "")
-
-        if response == "0":
-            return (True, "")
+        parsed = cls._FAST_RESPONSES.get(response)
+        if parsed is not None:
+            return parsed
 
-        if response.startswith("1 "):
+        # Empty and exact codes are answered by _FAST_RESPONSES above
+        if response[:2] == "1 ":
             # Extract error message after "1 "
-            error_msg = response[2:].strip()
-            return (False, error_msg)
-
-        if response == "1":
-            return (False, "")
+            return (False, response[2:].strip())
 
         # Unexpected response
         return (False, "")
@@ -316,40 +467,39 @@ class HVPPConfiguratorGUI:
         self.root.title("AVR Micro Processor HVPP Configurator GUI v1.0 (Python Edition)")
         self.root.resizable(False, False)
 
-        # Set application icon (extracted from original C# resources)
-        try:
-            base_path = Path(__file__).parent
-            if sys.platform.startswith("win"):
-                icon_path = base_path / "app_icon.ico"
-                if icon_path.exists():
-                    self.root.iconbitmap(str(icon_path))
-                elif DEBUG_PRINT:
-                    print("Windows icon file not found.")
-            else:
-                icon_path = base_path / "app_icon.png"
-                if icon_path.exists():
-                    self._icon_image = tk.PhotoImage(file=str(icon_path))
-                    self.root.iconphoto(True, self._icon_image)
-                elif DEBUG_PRINT:
-                    print("Linux icon file not found.")
-        except Exception as ex:
-            if DEBUG_PRINT:
-                print(f"Failed to set icon: {ex}")
+        # Set application icon once the main loop is running (not needed to build the window)
+        self.root.after_idle(self._set_icon)
 
         self.programmer: Optional[AtmelHighVoltageParallelProgrammer] = None
-        self._operation_thread: Optional[threading.Thread] = None
+        self._operation_future: Optional[concurrent.futures.Future] = None
+        self._finish_operation: Optional[Callable[[Optional[str], Optional[Exception]], None]] = None
 
-        # Load fuse definitions
+        # Single persistent serial I/O worker: programmer commands and memory
+        # operations run outside the Tk main thread, in submission order
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="hvpp-io")
+        self._pending_commands: set[concurrent.futures.Future] = set()  # Submitted, not finished yet
+        self._connection_id = 0  # Incremented on connection loss: older results are ignored
+
+        # Fuse definitions (JSON file read on first tooltip display)
         base_path = Path(__file__).parent
         fuse_definitions_path = base_path / "fuse_definitions.json"
         self.fuse_defs = FuseDefinitions(fuse_definitions_path)
         self._stop_event = threading.Event()
         self._busy = False
+        self._closing = False  # Exit requested, END command pending
+        self._connect_future: Optional[concurrent.futures.Future] = None  # Connection being opened
         self._is_connected = False  # Track connection state
         self._toast_timer = None  # Timer for toast notifications
+        self._about_window: Optional[tk.Toplevel] = None  # Built on first use
+        self._last_ports: Optional[list[str]] = None  # Ports currently listed in port_combo
+        self._progress_total = 0  # Current progress bar maximum
+        self._progress_latest: Optional[tuple[int, int]] = None  # Last (current, total) from the worker
+        self._progress_drawn: Optional[tuple[int, int]] = None  # Sample currently shown by the bar
+        self._progress_job = None  # Pending _drain_progress timer
 
         self._create_widgets()
-        self._load_ports()
+        # Serial ports are listed once the window is shown (comports() can be slow)
+        self.root.after_idle(self._load_ports)
 
         self._init_busy_widgets()
 
@@ -359,6 +509,27 @@ class HVPPConfiguratorGUI:
         # Handle window close
         self.root.protocol("WM_DELETE_WINDOW", self._on_closing)
 
+    def _set_icon(self):
+        """Set application icon (extracted from original C# resources)"""
+        try:
+            base_path = Path(__file__).parent
+            if sys.platform.startswith("win"):
+                icon_path = base_path / "app_icon.ico"
+                if icon_path.exists():
+                    self.root.iconbitmap(str(icon_path))
+                elif DEBUG_PRINT:
+                    print("Windows icon file not found.")
+            else:
+                icon_path = base_path / "app_icon.png"
+                if icon_path.exists():
+                    self._icon_image = tk.PhotoImage(file=str(icon_path))
+                    self.root.iconphoto(True, self._icon_image)
+                elif DEBUG_PRINT:
+                    print("Linux icon file not found.")
+        except Exception as ex:
+            if DEBUG_PRINT:
+                print(f"Failed to set icon: {ex}")
+
     def _create_widgets(self):
         """Create all GUI widgets"""
 
@@ -411,6 +582,17 @@ class HVPPConfiguratorGUI:
         self.port_combo = ttk.Combobox(chip_frame, state="readonly", width=10)
         self.port_combo.grid(row=0, column=3, padx=5)
 
+        # Link speed (only changed if the firmware supports it)
+        ttk.Label(chip_frame, text="Baud:").grid(row=1, column=2, sticky="w", padx=5, pady=(5, 0))
+        self.baud_combo = ttk.Combobox(
+            chip_frame,
+            values=AtmelHighVoltageParallelProgrammer.SUPPORTED_BAUD_RATES,
+            state="readonly",
+            width=10,
+        )
+        self.baud_combo.set(AtmelHighVoltageParallelProgrammer.BAUD_RATE)
+        self.baud_combo.grid(row=1, column=3, padx=5, pady=(5, 0))
+
         # Refresh Ports button
         self.refresh_ports_btn = ttk.Button(chip_frame, text="⟳", width=3, command=self._on_refresh_ports)
         self.refresh_ports_btn.grid(row=0, column=4, padx=(0, 5))
@@ -443,59 +625,60 @@ class HVPPConfiguratorGUI:
         self.read_cal_btn.grid(row=0, column=2, padx=5)
 
         # Erase Chip button
-        self.erase_btn = ttk.Button(func_frame, text="Erase Chip", command=self._on_erase_chip)
+        self.erase_btn = ttk.Button(func_frame, text="Erase Chip", command=partial(
+            self._do_simple_write, HVPPCommand.CHIP_ERASE,
+            "Chip has been erased successfully.", "erase chip"))
         self.erase_btn.grid(row=0, column=3, padx=5)
 
         # Write Lock Byte button
-        self.lock_btn = ttk.Button(func_frame, text="Write Lock Byte", command=self._on_write_lock)
+        self.lock_btn = ttk.Button(func_frame, text="Write Lock Byte", command=partial(
+            self._do_simple_write, HVPPCommand.WRITE_LOCK_BYTE,
+            "Lock byte has been saved successfully.", "write lock byte"))
         self.lock_btn.grid(row=0, column=4, padx=5)
 
         # ===== Fuse Settings Section =====
         fuse_frame = ttk.LabelFrame(self.root, text="Fuse Settings", padding=10)
         fuse_frame.grid(row=2, column=0, padx=10, pady=5, sticky="ew")
 
-        # Low Fuse
-        ttk.Label(fuse_frame, text="Low Fuse:").grid(row=0, column=0, sticky="w", padx=5)
-        self.lfuse_entry = ttk.Entry(fuse_frame, width=10, justify="center")
-        self.lfuse_entry.grid(row=0, column=1, padx=5)
-        ToolTip(self.lfuse_entry, lambda: self.fuse_defs.get_fuse_tooltip(
-            self.chip_combo.get(), "low", self.lfuse_entry.get()))
-
-        # High Fuse
-        ttk.Label(fuse_frame, text="High Fuse:").grid(row=0, column=2, sticky="w", padx=5)
-        self.hfuse_entry = ttk.Entry(fuse_frame, width=10, justify="center")
-        self.hfuse_entry.grid(row=0, column=3, padx=5)
-        ToolTip(self.hfuse_entry, lambda: self.fuse_defs.get_fuse_tooltip(
-            self.chip_combo.get(), "high", self.hfuse_entry.get()))
-
-        # Extended Fuse
-        ttk.Label(fuse_frame, text="Extended Fuse:").grid(row=0, column=4, sticky="w", padx=5)
-        self.efuse_entry = ttk.Entry(fuse_frame, width=10, justify="center")
-        self.efuse_entry.grid(row=0, column=5, padx=5)
-        ToolTip(self.efuse_entry, lambda: self.fuse_defs.get_fuse_tooltip(
-            self.chip_combo.get(), "ext", self.efuse_entry.get()))
-
-        # Lock Byte
-        ttk.Label(fuse_frame, text="Lock Byte:").grid(row=0, column=6, sticky="w", padx=5)
-        self.lock_entry = ttk.Entry(fuse_frame, width=10, justify="center")
-        self.lock_entry.grid(row=0, column=7, padx=5)
-        ToolTip(self.lock_entry, lambda: self.fuse_defs.get_fuse_tooltip(
-            self.chip_combo.get(), "lock", self.lock_entry.get()))
+        # Fuse and lock entries: (label, fuse type in definitions, attribute name)
+        fuse_specs = (
+            ("Low Fuse:", "low", "lfuse_entry"),
+            ("High Fuse:", "high", "hfuse_entry"),
+            ("Extended Fuse:", "ext", "efuse_entry"),
+            ("Lock Byte:", "lock", "lock_entry"),
+        )
+        for i, (label_text, fuse_type, attr_name) in enumerate(fuse_specs):
+            ttk.Label(fuse_frame, text=label_text).grid(row=0, column=2 * i, sticky="w", padx=5)
+            entry = ttk.Entry(fuse_frame, width=10, justify="center")
+            entry.grid(row=0, column=2 * i + 1, padx=5)
+            ToolTip(entry, lambda e=entry, t=fuse_type: self.fuse_defs.get_fuse_tooltip(
+                self.chip_combo.get(), t, e.get()),
+                cache_key=lambda e=entry: (self.chip_combo.get(), e.get()))
+            setattr(self, attr_name, entry)
 
         # Read Fuses button
         self.read_fuses_btn = ttk.Button(fuse_frame, text="Read Fuses", command=self._on_read_fuses)
         self.read_fuses_btn.grid(row=0, column=8, padx=5)
 
         # Write buttons
-        self.write_lfuse_btn = ttk.Button(fuse_frame, text="Write Low Fuse", command=self._on_write_lfuse)
+        self.write_lfuse_btn = ttk.Button(fuse_frame, text="Write Low Fuse", command=partial(
+            self._do_simple_write, HVPPCommand.WRITE_LFUSE,
+            "Low fuse has been saved successfully.", "write low fuse", self.lfuse_entry, "Low fuse"))
         self.write_lfuse_btn.grid(row=1, column=0, columnspan=2, padx=5, pady=5)
 
-        self.write_hfuse_btn = ttk.Button(fuse_frame, text="Write High Fuse", command=self._on_write_hfuse)
+        self.write_hfuse_btn = ttk.Button(fuse_frame, text="Write High Fuse", command=partial(
+            self._do_simple_write, HVPPCommand.WRITE_HFUSE,
+            "High fuse has been saved successfully.", "write high fuse", self.hfuse_entry, "High fuse"))
         self.write_hfuse_btn.grid(row=1, column=2, columnspan=2, padx=5, pady=5)
 
-        self.write_efuse_btn = ttk.Button(fuse_frame, text="Write Extended Fuse", command=self._on_write_efuse)
+        self.write_efuse_btn = ttk.Button(fuse_frame, text="Write Extended Fuse", command=partial(
+            self._do_simple_write, HVPPCommand.WRITE_EXT_FUSE,
+            "Extended fuse has been saved successfully.", "write extended fuse", self.efuse_entry, "Extended fuse"))
         self.write_efuse_btn.grid(row=1, column=4, columnspan=2, padx=5, pady=5)
 
+        self.write_fuses_btn = ttk.Button(fuse_frame, text="Write All Fuses", command=self._on_write_all_fuses)
+        self.write_fuses_btn.grid(row=1, column=6, columnspan=2, padx=5, pady=5)
+
         # ===== Memory Operations Section =====
         memory_frame = ttk.LabelFrame(self.root, text="Memory Operations", padding=10)
         memory_frame.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
@@ -531,6 +714,9 @@ class HVPPConfiguratorGUI:
         self.operation_label.grid(row=3, column=0, columnspan=5, sticky="w", padx=5, pady=(0, 2))
         self.progress_label = ttk.Label(memory_frame, text="")
         self.progress_label.grid(row=4, column=0, columnspan=5, sticky="w", padx=5, pady=(0, 5))
+        # Bound once: _update_progress is called for every progress refresh
+        self._progress_bar_configure = self.progress_bar.configure
+        self._progress_label_configure = self.progress_label.configure
 
         # ===== Bottom Buttons =====
         button_frame = ttk.Frame(self.root)
@@ -545,6 +731,10 @@ class HVPPConfiguratorGUI:
     def _load_ports(self):
         """Load available serial ports"""
         ports = AtmelHighVoltageParallelProgrammer.get_available_ports()
+        if ports == self._last_ports:
+            return  # Unchanged, keep combobox values and selection
+
+        self._last_ports = ports
         self.port_combo['values'] = ports
         if ports:
             self.port_combo.current(0)
@@ -564,68 +754,71 @@ class HVPPConfiguratorGUI:
         self.root.after(500, lambda: self.refresh_ports_btn.config(text=original_text))
 
     def _init_busy_widgets(self):
-        """Initialize widget tracking (kept for compatibility but no longer used)."""
-        # This method is kept for compatibility but widget state management
-        # is now handled by _update_connection_state() and _set_controls_busy()
-        pass
-
-    def _set_connection_controls(self, enabled: bool):
-        """Enable or disable connection interface controls.
-
-        Args:
-            enabled: True to enable controls, False to disable
-        """
-        state = "readonly" if enabled else "disabled"
-        self.chip_combo.config(state=state)
-        self.port_combo.config(state=state)
+        """Precompute widget states for the connected, disconnected and busy situations."""
+        connection_combos = (self.chip_combo, self.port_combo, self.baud_combo)
+        connection_buttons = (self.refresh_ports_btn, self.connect_btn)
+        exit_buttons = (self.exit_btn,)
+        operation_buttons = (
+            # Programmer operation buttons
+            self.disconnect_btn,
+            self.read_sig_btn,
+            self.read_cal_btn,
+            self.erase_btn,
+            self.lock_btn,
+            self.read_fuses_btn,
+            self.write_lfuse_btn,
+            self.write_hfuse_btn,
+            self.write_efuse_btn,
+            self.write_fuses_btn,
+            # Memory operation buttons
+            self.read_flash_btn,
+            self.write_flash_btn,
+            self.verify_flash_btn,
+            self.read_eeprom_btn,
+            self.write_eeprom_btn,
+            self.verify_eeprom_btn,
+        )
 
-        btn_state = "normal" if enabled else "disabled"
-        self.refresh_ports_btn.config(state=btn_state)
-        self.connect_btn.config(state=btn_state)
+        def states(
+            connection_enabled: bool, operation_enabled: bool, stop_enabled: bool, exit_enabled: bool = True
+        ) -> tuple:
+            table = {w: "readonly" if connection_enabled else "disabled" for w in connection_combos}
+            table.update({w: "normal" if connection_enabled else "disabled" for w in connection_buttons})
+            table.update({w: "normal" if operation_enabled else "disabled" for w in operation_buttons})
+            table.update({w: "normal" if exit_enabled else "disabled" for w in exit_buttons})
+            table[self.stop_btn] = "normal" if stop_enabled else "disabled"
+            # Flat (path, state, path, state, ...) list for the Tcl proc below
+            return tuple(item for widget, state in table.items() for item in (str(widget), state))
+
+        self._state_connected = states(False, True, False)
+        self._state_disconnected = states(True, False, False)
+        self._state_busy = states(False, False, True)
+        self._state_locked = states(False, False, False, False)  # Connect/disconnect/exit in progress
+
+        # All state changes of a table are done by a single Tcl call
+        self.root.tk.eval(
+            "proc hvpp_set_states {pairs} {"
+            " foreach {path state} $pairs { $path configure -state $state } }"
+        )
 
-    def _set_operation_controls(self, enabled: bool):
-        """Enable or disable programmer operation controls.
-
-        Args:
-            enabled: True to enable controls, False to disable
-        """
-        state = "normal" if enabled else "disabled"
-
-        # Programmer operation buttons
-        self.disconnect_btn.config(state=state)
-        self.read_sig_btn.config(state=state)
-        self.read_cal_btn.config(state=state)
-        self.erase_btn.config(state=state)
-        self.lock_btn.config(state=state)
-        self.read_fuses_btn.config(state=state)
-        self.write_lfuse_btn.config(state=state)
-        self.write_hfuse_btn.config(state=state)
-        self.write_efuse_btn.config(state=state)
-
-        # Memory operation buttons
-        self.read_flash_btn.config(state=state)
-        self.write_flash_btn.config(state=state)
-        self.verify_flash_btn.config(state=state)
-        self.read_eeprom_btn.config(state=state)
-        self.write_eeprom_btn.config(state=state)
-        self.verify_eeprom_btn.config(state=state)
+    def _apply_widget_states(self, table: tuple):
+        """Apply a precomputed widget state table (see _init_busy_widgets)."""
+        self.root.tk.call("hvpp_set_states", table)
 
     def _set_controls_busy(self, busy: bool):
         """Enable/disable controls during long-running operations."""
         if busy:
-            # Disable all controls
-            self._set_connection_controls(False)
-            self._set_operation_controls(False)
+            # Disable all controls except Stop
+            self._apply_widget_states(self._state_busy)
             self.log_menu_item.entryconfig(self.log_menu_index, state="disabled")
-            self.stop_btn.config(state="normal")
         else:
             # Restore state based on connection status
-            self.stop_btn.config(state="disabled")
             self._update_connection_state(self._is_connected)
 
     def _clear_progress(self):
         """Clear progress bar and labels."""
         self.progress_bar["value"] = 0
+        self._progress_total = 0
         self.operation_label.config(text="")
         self.progress_label.config(text="")
 
@@ -692,8 +885,7 @@ class HVPPConfiguratorGUI:
             self.log_menu_item.entryconfig(self.log_menu_index, state="normal")
 
             # Disable connection controls, enable operation controls
-            self._set_connection_controls(False)
-            self._set_operation_controls(True)
+            self._apply_widget_states(self._state_connected)
         else:
             # Disable Programmer Log menu option
             self.log_menu_item.entryconfig(self.log_menu_index, state="disabled")
@@ -702,17 +894,31 @@ class HVPPConfiguratorGUI:
             self._clear_data_fields()
 
             # Enable connection controls, disable operation controls
-            self._set_connection_controls(True)
-            self._set_operation_controls(False)
+            self._apply_widget_states(self._state_disconnected)
 
     def _handle_disconnection(self):
         """Handle programmer disconnection (e.g., cable unplugged, port unavailable)"""
-        if self.programmer:
-            try:
-                self.programmer.close()
-            except:
-                pass
-            self.programmer = None
+        # Commands still queued would each wait for their timeout on a dead port,
+        # and the result of the one running belongs to the lost connection
+        self._connection_id += 1
+        for future in list(self._pending_commands):
+            future.cancel()
+        if self._busy:
+            # Memory operation dropped before reaching the port
+            self._set_busy(False)
+            self._busy = False
+            self._clear_progress()
+
+        programmer, self.programmer = self.programmer, None
+        if programmer:
+            def close():
+                # On the worker: the port may still be in use by the running command
+                try:
+                    programmer.close()
+                except (serial.SerialException, OSError):
+                    pass
+
+            self._executor.submit(close)
 
         # Update to disconnected state (includes menu, fields clearing, and buttons)
         self._update_connection_state(False)
@@ -724,20 +930,46 @@ class HVPPConfiguratorGUI:
         """Handle Connect button click"""
         chip = self.chip_combo.get()
         port = self.port_combo.get()
+        baud_rate = int(self.baud_combo.get())
 
         if not chip or not port:
             messagebox.showerror("Error",
                 "Please select the chip and serial port before connecting to the programmer.")
             return
 
-        try:
-            if self.programmer:
-                self.programmer.close()
-
-            self.programmer = AtmelHighVoltageParallelProgrammer(port, chip)
+        previous = self.programmer
+        self.programmer = None
 
-            result = self.programmer.programmer_communicate(HVPPCommand.OPEN, "")
+        def connect() -> tuple[AtmelHighVoltageParallelProgrammer, str]:
+            # Runs on the I/O worker: opening the port and the handshake can take a while
+            if previous:
+                try:
+                    previous.close()
+                except (serial.SerialException, OSError):
+                    pass
+            programmer = AtmelHighVoltageParallelProgrammer(port, chip, baud_rate)
+            try:
+                return programmer, programmer.programmer_communicate(HVPPCommand.OPEN, "")
+            except Exception:
+                try:
+                    programmer.close()
+                except (serial.SerialException, OSError):
+                    pass
+                raise
 
+        def on_result(connection: tuple[AtmelHighVoltageParallelProgrammer, str]):
+            self._connect_future = None
+            if self._closing:
+                return  # The connection is ended and closed by _end_session
+            self._set_busy(False)
+            self.programmer, result = connection
+            # Show the speed actually in use, warn if it is not the selected one
+            actual_baud_rate = self.programmer.serial_port.baudrate
+            self.baud_combo.set(actual_baud_rate)
+            if actual_baud_rate != baud_rate:
+                messagebox.showwarning("Warning",
+                    f"Link speed kept at {actual_baud_rate} bauds instead of {baud_rate}:\n"
+                    f"{self.programmer.baud_rate_warning}")
             if self._handle_programmer_response(
                 result,
                 "✓ HVPP mode enabled successfully",
@@ -746,32 +978,108 @@ class HVPPConfiguratorGUI:
             ):
                 # Update to connected state (includes enabling Programmer Log menu)
                 self._update_connection_state(True)
-        except serial.SerialException as e:
-            # Port already in use or unavailable
-            error_msg = str(e)
-            if "Access is denied" in error_msg or "Permission denied" in error_msg:
-                messagebox.showerror("Error",
-                    f"Port {port} is already in use by another application.\n\nPlease close the other application and try again.")
             else:
-                messagebox.showerror("Error", f"Serial port error: {error_msg}")
-            # Ensure disconnected state
-            self._update_connection_state(False)
-            if self.programmer:
-                try:
-                    self.programmer.close()
-                except:
-                    pass
-                self.programmer = None
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to connect: {str(e)}")
+                self._update_connection_state(False)
+
+        def on_error(error: Exception):
+            self._connect_future = None
+            if self._closing:
+                return
+            self._set_busy(False)
+            if isinstance(error, serial.SerialException):
+                # Port already in use or unavailable
+                error_msg = str(error)
+                if "Access is denied" in error_msg or "Permission denied" in error_msg:
+                    messagebox.showerror("Error",
+                        f"Port {port} is already in use by another application.\n\nPlease close the other application and try again.")
+                else:
+                    messagebox.showerror("Error", f"Serial port error: {error_msg}")
+            else:
+                messagebox.showerror("Error", f"Failed to connect: {str(error)}")
             # Ensure disconnected state
             self._update_connection_state(False)
-            if self.programmer:
-                try:
-                    self.programmer.close()
-                except:
-                    pass
-                self.programmer = None
+
+        # No re-entry while the connection is being opened
+        self._apply_widget_states(self._state_locked)
+        self._set_busy(True)
+        self._connect_future = self._run_task(connect, (), on_result, on_error)
+
+    def _run_command(
+        self,
+        cmd: HVPPCommand,
+        parameters: str,
+        on_result: Callable[[str], None],
+        on_error: Optional[Callable[[Exception], None]] = None
+    ):
+        """
+        Submit a programmer command to the serial I/O worker thread
+
+        Args:
+            cmd: Command to send
+            parameters: Parameters for the command
+            on_result: Called on the Tk main thread with the programmer response
+            on_error: Called on the Tk main thread with the exception raised by the
+                command (default: _on_command_error)
+        """
+        self._run_task(self.programmer.programmer_communicate, (cmd, parameters), on_result, on_error)
+
+    def _run_task(
+        self,
+        func: Callable[..., str],
+        args: tuple,
+        on_result: Callable[[str], None],
+        on_error: Optional[Callable[[Exception], None]] = None
+    ) -> concurrent.futures.Future:
+        """
+        Submit a programmer call to the serial I/O worker thread
+
+        Args:
+            func: Programmer method to call
+            args: Arguments for func
+            on_result: Called on the Tk main thread with the value returned by func
+            on_error: Called on the Tk main thread with the exception raised by func
+                (default: _on_command_error)
+
+        Returns:
+            Future of the submitted call
+        """
+        if on_error is None:
+            on_error = self._on_command_error
+        connection_id = self._connection_id
+
+        def done(future: concurrent.futures.Future):
+            # Called from the worker thread, hop back to the Tk main thread
+            self._pending_commands.discard(future)
+            if not future.cancelled():
+                self._call_in_tk(self._on_command_done, future, connection_id, on_result, on_error)
+
+        future = self._executor.submit(func, *args)
+        self._pending_commands.add(future)
+        future.add_done_callback(done)
+        return future
+
+    def _on_command_done(
+        self,
+        future: concurrent.futures.Future,
+        connection_id: int,
+        on_result: Callable[[str], None],
+        on_error: Callable[[Exception], None]
+    ):
+        """Dispatch the outcome of a submitted programmer command (Tk main thread)"""
+        if connection_id != self._connection_id:
+            return  # Connection lost since the command was submitted
+        error = future.exception()
+        if error is not None:
+            on_error(error)
+        else:
+            on_result(future.result())
+
+    def _on_command_error(self, error: Exception):
+        """Default handling of an exception raised by a submitted programmer command"""
+        if isinstance(error, serial.SerialException):
+            self._handle_disconnection()
+        else:
+            raise error
 
     def _on_read_signature(self):
         """Handle Read Signature button click"""
@@ -779,29 +1087,33 @@ class HVPPConfiguratorGUI:
             messagebox.showwarning("Warning", "Please connect to the programmer first.")
             return
 
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.READ_SIGNATURE, "")
+        def on_result(result: str):
             self.signature_entry.delete(0, tk.END)
             self.signature_entry.insert(0, result)
-        except serial.SerialException:
-            self._handle_disconnection()
+
+        self._run_command(HVPPCommand.READ_SIGNATURE, "", on_result)
 
     def _on_disconnect(self):
         """Handle Disconnect button click"""
         if self.programmer:
-            try:
-                result = self.programmer.programmer_communicate(HVPPCommand.END, "")
+            def on_result(result: str):
                 self._handle_programmer_response(
                     result,
                     "HVPP mode has ended successfully.",
                     error_context="end HVPP mode"
                 )
-            except serial.SerialException:
+                # Update to disconnected state (includes menu, fields clearing, and buttons)
+                self._update_connection_state(False)
+
+            def on_error(error: Exception):
+                if not isinstance(error, serial.SerialException):
+                    self._update_connection_state(True)
+                    raise error
                 # Connection already lost, no need to show error
-                pass
+                self._update_connection_state(False)
 
-            # Update to disconnected state (includes menu, fields clearing, and buttons)
-            self._update_connection_state(False)
+            self._apply_widget_states(self._state_locked)
+            self._run_command(HVPPCommand.END, "", on_result, on_error)
 
     def _on_read_fuses(self):
         """Handle Read Fuses button click"""
@@ -809,32 +1121,28 @@ class HVPPConfiguratorGUI:
             messagebox.showwarning("Warning", "Please connect to the programmer first.")
             return
 
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.READ_FUSES, "")
+        def on_result(result: str):
             if DEBUG_PRINT:
                 print(f"DEBUG _on_read_fuses: résultat brut = '{result}' (longueur: {len(result)})")
 
-            fuses = result.split(' ')
+            # Response format: "lfuse hfuse efuse lock"
+            fuses = result.split()  # One token per field, spacing ignored
+            if len(fuses) != 4:
+                messagebox.showerror("Error", f"Invalid response format. Received: '{result}' ({len(fuses)} elements instead of 4)")
+                return
             if DEBUG_PRINT:
-                print(f"DEBUG _on_read_fuses: fuses après split = {fuses} (nombre: {len(fuses)})")
-            if len(fuses) >= 4:
-                self.lfuse_entry.delete(0, tk.END)
-                self.lfuse_entry.insert(0, fuses[0])
+                print(f"DEBUG _on_read_fuses: fuses après split = {fuses}")
 
-                self.hfuse_entry.delete(0, tk.END)
-                self.hfuse_entry.insert(0, fuses[1])
+            for entry, value in zip(
+                (self.lfuse_entry, self.hfuse_entry, self.efuse_entry, self.lock_entry),
+                fuses
+            ):
+                entry.delete(0, tk.END)
+                entry.insert(0, value)
+            if DEBUG_PRINT:
+                print("DEBUG _on_read_fuses: data displayed in fields")
 
-                self.efuse_entry.delete(0, tk.END)
-                self.efuse_entry.insert(0, fuses[2])
-
-                self.lock_entry.delete(0, tk.END)
-                self.lock_entry.insert(0, fuses[3])
-                if DEBUG_PRINT:
-                    print("DEBUG _on_read_fuses: data displayed in fields")
-            else:
-                messagebox.showerror("Error", f"Invalid response format. Received: '{result}' ({len(fuses)} elements instead of 4)")
-        except serial.SerialException:
-            self._handle_disconnection()
+        self._run_command(HVPPCommand.READ_FUSES, "", on_result)
 
     def _on_read_calibration(self):
         """Handle Read Calibration Byte button click"""
@@ -842,122 +1150,77 @@ class HVPPConfiguratorGUI:
             messagebox.showwarning("Warning", "Please connect to the programmer first.")
             return
 
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.READ_CALIBRATION_BYTE, "")
+        def on_result(result: str):
             self.calibration_entry.delete(0, tk.END)
             self.calibration_entry.insert(0, result)
-        except serial.SerialException:
-            self._handle_disconnection()
-
-    def _on_write_lfuse(self):
-        """Handle Write Low Fuse button click"""
-        if not self.programmer:
-            messagebox.showwarning("Warning", "Please connect to the programmer first.")
-            return
-
-        lfuse = self.lfuse_entry.get()
-        if not lfuse:
-            messagebox.showerror("Error", "Low fuse cannot be empty.")
-            return
-
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.WRITE_LFUSE, lfuse)
-
-            self._handle_programmer_response(
-                result,
-                "Low fuse has been saved successfully.",
-                error_context="write low fuse"
-            )
-        except serial.SerialException:
-            self._handle_disconnection()
-
-    def _on_write_hfuse(self):
-        """Handle Write High Fuse button click"""
-        if not self.programmer:
-            messagebox.showwarning("Warning", "Please connect to the programmer first.")
-            return
-
-        hfuse = self.hfuse_entry.get()
-        if not hfuse:
-            messagebox.showerror("Error", "High fuse cannot be empty.")
-            return
 
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.WRITE_HFUSE, hfuse)
-
-            self._handle_programmer_response(
-                result,
-                "High fuse has been saved successfully.",
-                error_context="write high fuse"
-            )
-        except serial.SerialException:
-            self._handle_disconnection()
+        self._run_command(HVPPCommand.READ_CALIBRATION_BYTE, "", on_result)
 
-    def _on_write_efuse(self):
-        """Handle Write Extended Fuse button click"""
-        if not self.programmer:
-            messagebox.showwarning("Warning", "Please connect to the programmer first.")
-            return
-
-        efuse = self.efuse_entry.get()
-        if not efuse:
-            messagebox.showerror("Error", "Extended fuse cannot be empty.")
-            return
-
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.WRITE_EXT_FUSE, efuse)
-
-            self._handle_programmer_response(
-                result,
-                "Extended fuse has been saved successfully.",
-                error_context="write extended fuse"
-            )
-        except serial.SerialException:
-            self._handle_disconnection()
+    def _do_simple_write(
+        self,
+        cmd: HVPPCommand,
+        success_message: str,
+        error_context: str,
+        entry: Optional[ttk.Entry] = None,
+        entry_name: str = "",
+    ):
+        """
+        Handle the single command buttons (fuse writes, lock byte, chip erase)
 
-    def _on_erase_chip(self):
-        """Handle Erase Chip button click"""
+        Args:
+            cmd: Command to send
+            success_message: Message shown when the programmer answers "0"
+            error_context: Operation name used in error messages
+            entry: Entry holding the command parameter (None: no parameter)
+            entry_name: Parameter name for the "cannot be empty" message
+        """
         if not self.programmer:
             messagebox.showwarning("Warning", "Please connect to the programmer first.")
             return
 
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.CHIP_ERASE, "")
+        value = ""
+        if entry is not None:
+            value = entry.get()
+            if not value:
+                messagebox.showerror("Error", f"{entry_name} cannot be empty.")
+                return
 
-            self._handle_programmer_response(
-                result,
-                "Chip has been erased successfully.",
-                error_context="erase chip"
-            )
-        except serial.SerialException:
-            self._handle_disconnection()
+        self._run_command(cmd, value, lambda result: self._handle_programmer_response(
+            result,
+            success_message,
+            error_context=error_context
+        ))
 
-    def _on_write_lock(self):
-        """Handle Write Lock Byte button click"""
+    def _on_write_all_fuses(self):
+        """Handle Write All Fuses button click"""
         if not self.programmer:
             messagebox.showwarning("Warning", "Please connect to the programmer first.")
             return
 
-        try:
-            result = self.programmer.programmer_communicate(HVPPCommand.WRITE_LOCK_BYTE, "")
+        fuses = []
+        for entry, name in (
+            (self.lfuse_entry, "Low fuse"),
+            (self.hfuse_entry, "High fuse"),
+            (self.efuse_entry, "Extended fuse"),
+        ):
+            value = entry.get()
+            if not value:
+                messagebox.showerror("Error", f"{name} cannot be empty.")
+                return
+            fuses.append(value)
 
-            self._handle_programmer_response(
-                result,
-                "Lock byte has been saved successfully.",
-                error_context="write lock byte"
-            )
-        except serial.SerialException:
-            self._handle_disconnection()
+        self._run_task(self.programmer.programmer_write_fuses, tuple(fuses), lambda result: self._handle_programmer_response(
+            result,
+            "Fuses have been saved successfully.",
+            error_context="write fuses"
+        ))
 
     def _on_log_programmer(self):
         """Handle Programmer Log menu option"""
         if not self.programmer:
             return
 
-        try:
-            # Send LOG command (97) with timeout
-            result = self.programmer.programmer_communicate(HVPPCommand.LOG, "")
-
+        def on_result(result: str):
             # Remove only trailing newline
             result = result.rstrip('\r\n')
 
@@ -970,41 +1233,80 @@ class HVPPConfiguratorGUI:
             text_widget = tk.Text(log_window, wrap=tk.WORD, padx=10, pady=10)
             text_widget.pack(expand=True, fill=tk.BOTH)
 
-            # Insert text
-            text_widget.insert("1.0", result if result else "No log received")
+            # Insert text, by pieces of about LOG_INSERT_CHUNK characters cut on line ends
+            if not result:
+                text_widget.insert(tk.END, "No log received")
+            else:
+                insert = text_widget.insert
+                chunk = self.LOG_INSERT_CHUNK
+                start, length = 0, len(result)
+                while start < length:
+                    end = result.find('\n', start + chunk)
+                    end = length if end < 0 else end + 1
+                    insert(tk.END, result[start:end])
+                    start = end
             text_widget.config(state=tk.DISABLED)  # Read only
 
             # OK button to close
             ok_btn = ttk.Button(log_window, text="OK", command=log_window.destroy)
             ok_btn.pack(pady=5)
 
-        except serial.SerialException:
-            self._handle_disconnection()
-        except Exception as e:
-            messagebox.showerror("Error", f"Error reading log: {str(e)}")
+        def on_error(error: Exception):
+            if isinstance(error, serial.SerialException):
+                self._handle_disconnection()
+            else:
+                messagebox.showerror("Error", f"Error reading log: {str(error)}")
+
+        # Send LOG command (97) with timeout
+        self._run_command(HVPPCommand.LOG, "", on_result, on_error)
 
     def _set_busy(self, busy: bool):
         """Set busy cursor during long operations"""
+        # No update_idletasks(): the work runs on the I/O worker, so the event
+        # loop shows the new cursor on its next iteration
         cursor = "watch" if busy else ""
         try:
             self.root.config(cursor=cursor)
-            self.root.update_idletasks()
         except tk.TclError:
             cursor = "wait" if busy else ""
             try:
                 self.root.config(cursor=cursor)
-                self.root.update_idletasks()
             except tk.TclError:
                 pass
 
-    def _update_progress(self, label: str, current: int, total: int):
-        """Update progress bar and label"""
-        if total <= 0:
-            return
-        self.progress_bar["maximum"] = total
-        self.progress_bar["value"] = current
-        self.progress_label.config(text=f"{current}/{total}")
-        self.root.update_idletasks()
+    def _call_in_tk(self, func: Callable, *args):
+        """Run func(*args) on the Tk main thread without waiting (callable from any thread)"""
+        if tkthread is not None:
+            tkthread.call_nosync(func, *args)
+        else:
+            self.root.after(0, func, *args)
+
+    def _drain_progress(self):
+        """Show the latest progress sample, rescheduled while an operation is running"""
+        self._show_latest_progress()
+        if self._busy:
+            self._progress_job = self.root.after(self.PROGRESS_POLL_MS, self._drain_progress)
+        else:
+            self._progress_job = None
+
+    def _show_latest_progress(self):
+        """Apply the pending progress sample, if any, to the progress bar"""
+        # The slot is never cleared here: the worker may store a new sample at any
+        # time, it is drawn if it is not the one already shown
+        sample = self._progress_latest
+        if sample is not None and sample is not self._progress_drawn:
+            self._progress_drawn = sample
+            current, total = sample
+            if total != self._progress_total:
+                # The total is fixed for an operation: set from its first sample only
+                self._progress_total = total
+                self._progress_bar_configure(maximum=total)
+            self._update_progress(current, total)
+
+    def _update_progress(self, current: int, total: int):
+        """Update progress bar and label (maximum is set by _show_latest_progress)"""
+        self._progress_bar_configure(value=current)
+        self._progress_label_configure(text=f"{current}/{total}")
 
     def _start_memory_operation(
         self,
@@ -1025,7 +1327,7 @@ class HVPPConfiguratorGUI:
             hvpp_command: HVPP command type
             auto_verify: If True and write succeeds, automatically verify
         """
-        if self._operation_thread and self._operation_thread.is_alive():
+        if self._operation_future and not self._operation_future.done():
             return
 
         self._busy = True
@@ -1035,10 +1337,18 @@ class HVPPConfiguratorGUI:
         self._set_busy(True)
         self._set_controls_busy(True)
 
+        # The worker only stores the latest sample, the Tk thread polls it
+        self._progress_latest = None
+        self._progress_drawn = None
+        if self._progress_job is None:
+            self._progress_job = self.root.after(self.PROGRESS_POLL_MS, self._drain_progress)
+
         def progress_cb(current: int, total: int):
-            self.root.after(0, self._update_progress, label, current, total)
+            self._progress_latest = (current, total)
 
         def finish(result: Optional[str], error: Optional[Exception]):
+            # Last sample (current == total on success) not drawn yet by the poll
+            self._show_latest_progress()
             self._set_busy(False)
             self._set_controls_busy(False)
             self._busy = False
@@ -1050,25 +1360,21 @@ class HVPPConfiguratorGUI:
                     self._clear_progress()
                     return
 
-                if str(error) != "Operation stopped":
+                if not isinstance(error, OperationStoppedError):
                     # Clear input buffer for any error (except operation stopped which already cleared it)
                     if self.programmer:
                         self.programmer._clear_input_buffer()
 
-                    # Check if error message is a firmware response (starts with "0" or "1")
-                    error_msg = str(error)
-                    if error_msg and (error_msg.startswith("0") or error_msg.startswith("1")):
-                        # Parse as firmware response
-                        self._handle_programmer_response(
-                            error_msg,
-                            success_message,
-                            error_context=label,
-                            success_title="Success",
-                            generic_error=f"{label} failed."
-                        )
+                    if isinstance(error, FirmwareResponseError):
+                        # Firmware status line already split by the exception
+                        message = error.payload.strip()
+                        if message:
+                            messagebox.showerror("Error", f"Failed to {label}: {message}")
+                        else:
+                            messagebox.showerror("Error", f"{label} failed.")
                     else:
                         # Regular exception message
-                        messagebox.showerror("Error", f"{label} failed: {error_msg}")
+                        messagebox.showerror("Error", f"{label} failed: {error}")
                 self._clear_progress()
                 return
 
@@ -1099,27 +1405,27 @@ class HVPPConfiguratorGUI:
                     auto_verify=False,  # Don't verify the verification!
                 ))
 
-        def worker():
-            try:
-                result = self.programmer.programmer_communicate(
-                    hvpp_command,
-                    command,
-                    progress_callback=progress_cb,
-                    stop_event=self._stop_event,
-                )
-                self.root.after(0, finish, result, None)
-            except Exception as exc:
-                self.root.after(0, finish, None, exc)
-
-        self._operation_thread = threading.Thread(target=worker, daemon=True)
-        self._operation_thread.start()
+        # Same path as the single commands: run on the I/O worker, finish on the Tk thread
+        self._finish_operation = finish
+        self._operation_future = self._run_task(
+            self.programmer.programmer_communicate,
+            (hvpp_command, command, progress_cb, self._stop_event),
+            lambda result: finish(result, None),
+            lambda error: finish(None, error),
+        )
 
     def _on_stop(self):
         """Handle Stop button click"""
         if self._busy:
             self.operation_label.config(text="Arrêt en cours...")
             self.stop_btn.config(state="disabled")
+            if self._operation_future is not None and self._operation_future.cancel():
+                # Still queued behind another command: dropped before reaching the port
+                self._finish_operation(None, OperationStoppedError())
+                return
             self._stop_event.set()
+            if self.programmer:
+                self.programmer.signal_stop()
 
     def _on_read_flash(self):
         """Handle Read Flash Memory button click"""
@@ -1138,8 +1444,8 @@ class HVPPConfiguratorGUI:
             return  # User cancelled
 
         # Calculate total pages for Flash
-        page_size = self.programmer.chip_props["flash_page_size"]
-        total_size = self.programmer.chip_props["flash_total_size"]
+        page_size = self.programmer.flash_page_size
+        total_size = self.programmer.flash_total_size
         total_pages = total_size // (page_size * 2)
 
         # Ask user for number of pages to read
@@ -1180,8 +1486,8 @@ class HVPPConfiguratorGUI:
             return  # User cancelled
 
         # Calculate total pages for EEPROM
-        page_size = self.programmer.chip_props["eeprom_page_size"]
-        total_size = self.programmer.chip_props["eeprom_total_size"]
+        page_size = self.programmer.eeprom_page_size
+        total_size = self.programmer.eeprom_total_size
         total_pages = total_size // page_size
 
         # Ask user for number of pages to read
@@ -1297,20 +1603,35 @@ class HVPPConfiguratorGUI:
 
     def _on_exit(self):
         """Handle Exit button click"""
-        if self.programmer:
-            try:
-                self.programmer.programmer_communicate(HVPPCommand.END, "")
-            except serial.SerialException:
-                pass  # Ignore disconnection on exit
-        self.root.quit()
+        self._end_session(self.root.quit)
 
     def _on_about(self):
         """Handle À propos menu option"""
+        # La fenêtre est construite une seule fois puis masquée/réaffichée
+        if self._about_window is None:
+            self._build_about_window()
+
+        # Infos du firmware si connecté
+        if self.programmer and hasattr(self.programmer, 'firmware_info') and self.programmer.firmware_info:
+            self._about_fw_info.config(text=self.programmer.firmware_info)
+            self._about_status_label.pack_forget()
+            self._about_firmware_frame.pack(pady=10)
+        else:
+            self._about_firmware_frame.pack_forget()
+            self._about_status_label.pack(pady=10)
+
+        self._about_window.deiconify()
+        self._about_window.lift()
+
+    def _build_about_window(self):
+        """Create the (hidden) À propos window"""
         # Créer une fenêtre À propos
         about_window = tk.Toplevel(self.root)
+        about_window.withdraw()
         about_window.title("À propos")
         about_window.geometry("400x275")
         about_window.resizable(False, False)
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
 
         # Titre
         title_label = tk.Label(about_window, text="AVR HVPP Configurator GUI",
@@ -1326,22 +1647,21 @@ class HVPPConfiguratorGUI:
         separator = ttk.Separator(about_window, orient="horizontal")
         separator.pack(fill="x", padx=20, pady=10)
 
-        # Infos du firmware si connecté
-        if self.programmer and hasattr(self.programmer, 'firmware_info') and self.programmer.firmware_info:
-            firmware_frame = tk.Frame(about_window)
-            firmware_frame.pack(pady=10)
+        # Infos du firmware (contenu mis à jour à chaque affichage)
+        info_frame = tk.Frame(about_window)
+        info_frame.pack()
 
-            fw_title = tk.Label(firmware_frame, text="Programmer firmware:",
-                               font=("Arial", 10, "bold"))
-            fw_title.pack()
+        firmware_frame = tk.Frame(info_frame)
 
-            fw_info = tk.Label(firmware_frame, text=self.programmer.firmware_info,
-                              font=("Arial", 9))
-            fw_info.pack(pady=5)
-        else:
-            status_label = tk.Label(about_window, text="Programmer not connected",
-                                   font=("Arial", 9, "italic"), fg="gray")
-            status_label.pack(pady=10)
+        fw_title = tk.Label(firmware_frame, text="Programmer firmware:",
+                           font=("Arial", 10, "bold"))
+        fw_title.pack()
+
+        fw_info = tk.Label(firmware_frame, text="", font=("Arial", 9))
+        fw_info.pack(pady=5)
+
+        status_label = tk.Label(info_frame, text="Programmer not connected",
+                               font=("Arial", 9, "italic"), fg="gray")
 
         # Credits
         credits_frame = tk.Frame(about_window)
@@ -1356,17 +1676,58 @@ class HVPPConfiguratorGUI:
         credit2.pack()
 
         # Bouton OK
-        ok_btn = ttk.Button(about_window, text="OK", command=about_window.destroy)
+        ok_btn = ttk.Button(about_window, text="OK", command=about_window.withdraw)
         ok_btn.pack(pady=10)
 
+        self._about_window = about_window
+        self._about_firmware_frame = firmware_frame
+        self._about_fw_info = fw_info
+        self._about_status_label = status_label
+
     def _on_closing(self):
         """Handle window close event"""
+        self._end_session(self.root.destroy)
+
+    def _end_session(self, then: Callable[[], None]):
+        """Leave HVPP mode from the I/O worker, then stop it and call then() (exit/close)"""
+        if self._closing:
+            return
+        self._closing = True
+        # A running memory operation stops first, END is queued behind it
+        self._stop_event.set()
         if self.programmer:
-            try:
-                self.programmer.programmer_communicate(HVPPCommand.END, "")
-            except serial.SerialException:
-                pass  # Ignore disconnection on close
-        self.root.destroy()
+            self.programmer.signal_stop()
+        self._apply_widget_states(self._state_locked)
+
+        def done(_outcome=None):
+            # Errors are ignored: the application is closing anyway
+            self._shutdown_io()
+            then()
+
+        connect_future = self._connect_future
+        if connect_future is not None:
+            # Connection still being opened: END and close are queued behind it
+            # on the worker, shutdown waits for both
+            def end_connection() -> str:
+                try:
+                    programmer, _ = connect_future.result()
+                except Exception:
+                    return ""  # Not connected, nothing to end
+                try:
+                    return programmer.programmer_communicate(HVPPCommand.END, "")
+                finally:
+                    programmer.close()
+
+            self._run_task(end_connection, (), done, done)
+        elif self.programmer:
+            self._run_command(HVPPCommand.END, "", done, done)
+        else:
+            done()
+
+    def _shutdown_io(self):
+        """Stop the serial I/O worker (running memory operation is asked to stop)"""
+        self._stop_event.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
@@ -4,15 +4,45 @@ AVR High Voltage Parallel Programmer (HVPP) Module
 Port from C# to Python for cross-platform compatibility
 """
 
+import binascii
+import contextlib
+import os
+import struct
+import sys
 import serial
 import serial.tools.list_ports
 import time
 import threading
-from enum import Enum
-from typing import Callable, Optional, TypedDict
+from pathlib import Path
+from enum import IntEnum
+from typing import BinaryIO, Callable, Iterator, Optional, TypedDict
 
-# Debug messages control variable
-DEBUG_PRINT = False
+# tty ioctls used for low latency mode (POSIX only)
+try:
+    import fcntl
+    import termios
+except ImportError:
+    fcntl = None
+    termios = None
+
+# Debug messages control variable (also enabled by the HVPP_DEBUG=1 environment variable)
+DEBUG_PRINT = os.environ.get("HVPP_DEBUG", "0") not in ("", "0")
+
+
+class OperationStoppedError(RuntimeError):
+    """Memory operation interrupted by the stop event"""
+
+    def __init__(self):
+        super().__init__("Operation stopped")
+
+
+class FirmwareResponseError(RuntimeError):
+    """Firmware answered with a status line ("1 message") instead of the expected data"""
+
+    def __init__(self, response: str):
+        super().__init__(response)
+        self.response = response
+        self.payload = response[2:]  # Message after the "1 " status code
 
 
 class ChipProperties(TypedDict):
@@ -24,8 +54,91 @@ class ChipProperties(TypedDict):
     eeprom_total_size: int
 
 
-class HVPPCommand(Enum):
-    """Commands supported by the HVPP programmer"""
+class _IntelHexWriter:
+    """Intel HEX output written incrementally, 16 data bytes per record
+
+    Data is appended with write() as it becomes available (e.g. page by page),
+    close() writes the last partial record and the End Of File record.
+    """
+
+    BYTES_PER_LINE = 16
+
+    def __init__(self, f: BinaryIO):
+        self._file = f
+        # Same line ending as a text mode file on this platform
+        self._eol = os.linesep.encode("ascii")
+        self._pending = bytearray()  # Data not yet written as a record
+        self._offset = 0  # Address of the first pending byte
+        self._extended_address = 0
+
+    def write(self, data: bytes) -> None:
+        """Append data, complete records are written right away"""
+        pending = self._pending
+        pending += data
+        full = len(pending) - len(pending) % self.BYTES_PER_LINE
+        if full:
+            self._write_records(full)
+
+    def close(self) -> None:
+        """Write the remaining data and the End Of File record"""
+        if self._pending:
+            self._write_records(len(self._pending))
+        self._file.write(b":00000001FF" + self._eol)
+
+    def _write_records(self, length: int) -> None:
+        """Write the first length pending bytes as data records"""
+        eol = self._eol
+        bytes_per_line = self.BYTES_PER_LINE
+        hexlify = binascii.hexlify
+        pending = self._pending
+        out = bytearray()
+
+        for start in range(0, length, bytes_per_line):
+            offset = self._offset + start
+
+            # Calculate current extended address (upper 16 bits)
+            current_extended = (offset >> 16) & 0xFFFF
+
+            # Write Extended Linear Address record if needed (for addresses > 64KB)
+            if current_extended != self._extended_address:
+                self._extended_address = current_extended
+                # Format: :02000004XXXXCC
+                # 02 = byte count, 0000 = address, 04 = record type (extended linear address)
+                ext_addr_high = (current_extended >> 8) & 0xFF
+                ext_addr_low = current_extended & 0xFF
+                checksum = (0x02 + 0x00 + 0x00 + 0x04 + ext_addr_high + ext_addr_low) & 0xFF
+                checksum = (0x100 - checksum) & 0xFF
+                out += b":02000004%04X%02X" % (current_extended, checksum)
+                out += eol
+
+            # Get chunk of data
+            chunk = pending[start:min(start + bytes_per_line, length)]
+            byte_count = len(chunk)
+
+            # Calculate address (lower 16 bits)
+            address = offset & 0xFFFF
+
+            # Record type: 00 = data
+            record_type = 0x00
+
+            # Calculate checksum
+            checksum = byte_count + ((address >> 8) & 0xFF) + (address & 0xFF) + record_type + sum(chunk)
+            checksum = (0x100 - (checksum & 0xFF)) & 0xFF
+
+            # Data record (hex digits of the whole chunk formatted at once)
+            out += b":%02X%04X%02X%s%02X" % (byte_count, address, record_type, hexlify(chunk).upper(), checksum)
+            out += eol
+
+        self._file.write(out)
+        del pending[:length]
+        self._offset += length
+
+
+class HVPPCommand(IntEnum):
+    """Commands supported by the HVPP programmer
+
+    The value is the firmware command number, code its two-digit form sent on the link.
+    """
     NONE = -1
     OPEN = 0
     READ_SIGNATURE = 1
@@ -38,17 +151,75 @@ class HVPPCommand(Enum):
     READ_CALIBRATION_BYTE = 8
     READ_MEMORY = 9
     WRITE_MEMORY = 10
+    WRITE_FUSES_BATCH = 11
+    SET_BAUD = 12
     LOG = 97
     END = 99
     # Python-only operations (not sent to firmware)
     VERIFY_MEMORY = 100
 
+    def __init__(self, value: int):
+        self.code = f"{value:02d}"
+
 
 class AtmelHighVoltageParallelProgrammer:
     """Class for communicating with HVPP programmer via serial port"""
 
+    __slots__ = (
+        "serial_port", "in_string", "_in_buf", "chip_name", "chip_props", "chip_id",
+        "flash_page_size", "flash_total_size", "eeprom_page_size", "eeprom_total_size",
+        "data_received_ready", "firmware_info",
+        "fuses_batch_supported", "set_baud_supported", "binary_pages_supported",
+        "firmware_capabilities", "baud_rate_warning",
+    )
+
     BAUD_RATE = 230400
 
+    # USB-serial latency timer (ms) requested on Linux, driver default is usually 16 ms
+    LATENCY_TIMER_MS = 1
+
+    # Linux struct serial_struct: buffer size for TIOCGSERIAL and offset of its flags field
+    _SERIAL_STRUCT_SIZE = 128
+    _SERIAL_FLAGS_OFFSET = 16
+    _ASYNC_LOW_LATENCY = 1 << 13
+    # macOS IOSSDATALAT ioctl (_IOW('T', 0, unsigned long)): receive latency in µs
+    _IOSSDATALAT = 0x80085400
+
+    # Capability tokens: whole words of the firmware info (text after the first comma of
+    # the startup message), separated by spaces or commas, e.g. "v1.1 fuses_batch"
+
+    # Token advertised in the firmware startup message when WRITE_FUSES_BATCH is supported
+    FUSES_BATCH_CAPABILITY = "fuses_batch"
+
+    # Token advertised in the firmware startup message when page commands accept binary framing
+    BINARY_PAGES_CAPABILITY = "binary_pages"
+
+    # Token advertised in the firmware startup message when SET_BAUD is supported
+    SET_BAUD_CAPABILITY = "set_baud"
+
+    # Serial speeds offered for the link once connected (the firmware starts at BAUD_RATE)
+    SUPPORTED_BAUD_RATES = (230400, 250000, 500000, 1000000)
+
+    # Single firmware commands: command -> (expected response length
+    # (0: until newline), parameters sent)
+    _SIMPLE_COMMANDS: dict[HVPPCommand, tuple[int, bool]] = {
+        HVPPCommand.READ_SIGNATURE: (6, False),
+        HVPPCommand.READ_FUSES: (11, False),
+        HVPPCommand.WRITE_LFUSE: (0, True),
+        HVPPCommand.WRITE_HFUSE: (0, True),
+        HVPPCommand.WRITE_EXT_FUSE: (0, True),
+        HVPPCommand.WRITE_LOCK_BYTE: (0, False),
+        HVPPCommand.CHIP_ERASE: (0, False),
+        HVPPCommand.READ_CALIBRATION_BYTE: (2, False),
+        HVPPCommand.WRITE_FUSES_BATCH: (0, True),  # Parameters: "L:lfuse;H:hfuse;E:efuse"
+        HVPPCommand.SET_BAUD: (0, True),  # Parameters: speed in hex (6 digits)
+        HVPPCommand.LOG: (0, False),
+        HVPPCommand.END: (1, False),
+    }
+
+    # Multi-page operations (see programmer_communicate)
+    _MEMORY_COMMANDS = frozenset((HVPPCommand.READ_MEMORY, HVPPCommand.WRITE_MEMORY, HVPPCommand.VERIFY_MEMORY))
+
     # Chip properties database
     CHIP_PROPERTIES: dict[str, ChipProperties] = {
         "ATMEGA8(A)(L)": {
@@ -95,16 +266,19 @@ class AtmelHighVoltageParallelProgrammer:
         }
     }
 
-    def __init__(self, port: str, chip: str):
+    def __init__(self, port: str, chip: str, baud_rate: Optional[int] = None):
         """
         Initialize the HVPP programmer
 
         Args:
             port: Serial port name (e.g., 'COM3' on Windows, '/dev/ttyUSB0' on Linux)
             chip: Target chip name
+            baud_rate: Link speed to switch to after the startup message
+                (None: keep BAUD_RATE, ignored if the firmware cannot change it)
         """
         self.serial_port: Optional[serial.Serial] = None
         self.in_string = ""
+        self._in_buf = bytearray()  # Raw bytes of the response being received
         self.chip_name = chip
 
         # Get chip properties
@@ -113,8 +287,17 @@ class AtmelHighVoltageParallelProgrammer:
 
         self.chip_props = self.CHIP_PROPERTIES[chip]
         self.chip_id = self.chip_props["chip_id"]
+        self.flash_page_size = self.chip_props["flash_page_size"]
+        self.flash_total_size = self.chip_props["flash_total_size"]
+        self.eeprom_page_size = self.chip_props["eeprom_page_size"]
+        self.eeprom_total_size = self.chip_props["eeprom_total_size"]
         self.data_received_ready = False
         self.firmware_info = ""  # Stocker les infos du firmware
+        self.firmware_capabilities: frozenset[str] = frozenset()  # Tokens of firmware_info
+        self.fuses_batch_supported = False
+        self.set_baud_supported = False
+        self.binary_pages_supported = False
+        self.baud_rate_warning = ""  # Why the requested baud_rate is not in use ("": it is, or none requested)
 
         try:
             self.serial_port = serial.Serial(
@@ -128,6 +311,9 @@ class AtmelHighVoltageParallelProgrammer:
             if DEBUG_PRINT:
                 print(f"Port {port} opened")
 
+            self._enable_low_latency()
+            self._set_latency_timer(port)
+
             # Clear buffers
             self.serial_port.reset_input_buffer()
             self.serial_port.reset_output_buffer()
@@ -138,31 +324,28 @@ class AtmelHighVoltageParallelProgrammer:
             if DEBUG_PRINT:
                 print("Waiting for µC startup message...")
             startup_received = False
-            startup_timeout = time.time() + 10  # 10 secondes timeout
-            startup_buffer = ""
 
-            while time.time() < startup_timeout:
-                if self.serial_port.in_waiting > 0:
-                    data = self.serial_port.read(self.serial_port.in_waiting).decode('utf-8', errors='replace')
-                    startup_buffer += data
+            # Blocking read of the first line, 10 secondes timeout
+            self.serial_port.timeout = 10
+            try:
+                startup_buffer = self.serial_port.read_until(b"\n", size=256).decode('utf-8', errors='replace')
+            finally:
+                self.serial_port.timeout = 0.1
+            if DEBUG_PRINT:
+                print(f"Received at startup: '{startup_buffer}'")
+
+            # Check if we received the complete message (with newline)
+            if startup_buffer.endswith("\n"):
+                # Check the part before the comma
+                if startup_buffer.startswith("HVPP Configurator started"):
                     if DEBUG_PRINT:
-                        print(f"Received at startup: '{data}'")
-
-                    # Check if we received the complete message (with newline)
-                    if "\n" in startup_buffer:
-                        # Check the part before the comma
-                        if startup_buffer.startswith("HVPP Configurator started"):
-                            if DEBUG_PRINT:
-                                print(f"Startup message received: '{startup_buffer.strip()}'")
-                            # Extract info after the comma
-                            if "," in startup_buffer:
-                                self.firmware_info = startup_buffer.split(",", 1)[1].strip()
-                            startup_received = True
-                            break
-                        else:
-                            if DEBUG_PRINT:
-                                print(f"Unexpected message: '{startup_buffer.strip()}'")
-                time.sleep(0.1)
+                        print(f"Startup message received: '{startup_buffer.strip()}'")
+                    # Extract info after the comma
+                    if "," in startup_buffer:
+                        self.firmware_info = startup_buffer.split(",", 1)[1].strip()
+                    startup_received = True
+                elif DEBUG_PRINT:
+                    print(f"Unexpected message: '{startup_buffer.strip()}'")
 
             if not startup_received:
                 error_msg = f"Microcontroller did not send expected startup message. Received: '{startup_buffer.strip()}'"
@@ -171,15 +354,96 @@ class AtmelHighVoltageParallelProgrammer:
                 self.serial_port.close()
                 raise RuntimeError(error_msg)
 
+            # Optional firmware features (exact tokens, not substrings of the version text)
+            capabilities = frozenset(self.firmware_info.replace(",", " ").split())
+            self.firmware_capabilities = capabilities
+            self.fuses_batch_supported = self.FUSES_BATCH_CAPABILITY in capabilities
+            self.set_baud_supported = self.SET_BAUD_CAPABILITY in capabilities
+            self.binary_pages_supported = self.BINARY_PAGES_CAPABILITY in capabilities
+
+            if baud_rate and baud_rate != self.serial_port.baudrate:
+                if self.set_baud_supported:
+                    result = self.programmer_set_baud_rate(baud_rate)
+                    if result != "0":
+                        # Error or no answer: the firmware speed is unknown, the link cannot be used
+                        raise RuntimeError(f"Failed to set link speed to {baud_rate} bauds: {result}")
+                else:
+                    self.baud_rate_warning = "Baud rate change not supported by the firmware"
+
             if DEBUG_PRINT:
                 print("Microcontroller ready to communicate")
         except Exception as ex:
             if DEBUG_PRINT:
                 print(f"Port opening error: {ex}")
-            if self.serial_port and self.serial_port.is_open:
-                self.serial_port.close()
+            self.close()
             raise
 
+    def _enable_low_latency(self):
+        """
+        Ask the tty driver to deliver received bytes without delay (Linux, macOS)
+
+        On Linux the ASYNC_LOW_LATENCY flag can be set by the port owner
+        without privileges (ftdi_sio turns it into a 1 ms latency timer).
+        Failure is ignored: not every adapter supports it.
+        """
+        if fcntl is None:
+            return
+        try:
+            fd = self.serial_port.fileno()
+            if sys.platform.startswith("linux"):
+                serial_struct = bytearray(self._SERIAL_STRUCT_SIZE)
+                fcntl.ioctl(fd, termios.TIOCGSERIAL, serial_struct)
+                start = self._SERIAL_FLAGS_OFFSET
+                flags = int.from_bytes(serial_struct[start:start + 4], sys.byteorder)
+                if not flags & self._ASYNC_LOW_LATENCY:
+                    flags |= self._ASYNC_LOW_LATENCY
+                    serial_struct[start:start + 4] = flags.to_bytes(4, sys.byteorder)
+                    fcntl.ioctl(fd, termios.TIOCSSERIAL, serial_struct)
+            elif sys.platform == "darwin":
+                fcntl.ioctl(fd, self._IOSSDATALAT, struct.pack("L", 1))
+            else:
+                return
+            if DEBUG_PRINT:
+                print("Low latency mode enabled")
+        except (AttributeError, OSError, serial.SerialException) as ex:
+            if DEBUG_PRINT:
+                print(f"Could not enable low latency mode: {ex}")
+
+    def _set_latency_timer(self, port: str):
+        """
+        Lower the USB-serial adapter latency timer (Linux only)
+
+        Every short response otherwise waits up to the driver latency timer
+        (16 ms by default on FTDI adapters) before being delivered.
+        Writing the sysfs attribute usually requires root or a udev rule:
+        failure is ignored.
+
+        Args:
+            port: Serial port name (e.g., '/dev/ttyUSB0')
+        """
+        if not sys.platform.startswith("linux"):
+            return
+
+        # Resolve symlinks such as /dev/serial/by-id/... to the ttyUSBx name
+        device_name = Path(os.path.realpath(port)).name
+        latency_path = Path("/sys/bus/usb-serial/devices") / device_name / "latency_timer"
+        try:
+            if latency_path.exists():
+                latency_path.write_text(str(self.LATENCY_TIMER_MS))
+                if DEBUG_PRINT:
+                    print(f"Latency timer set to {self.LATENCY_TIMER_MS} ms ({latency_path})")
+        except OSError as ex:
+            if DEBUG_PRINT:
+                print(
+                    f"Could not set latency timer: {ex}. "
+                    f"Hint: echo {self.LATENCY_TIMER_MS} | sudo tee {latency_path}"
+                )
+
+    def signal_stop(self):
+        """Abort a pending page read (callable from any thread, set the stop event first)"""
+        if self.serial_port and self.serial_port.is_open:
+            self.serial_port.cancel_read()
+
     def close(self):
         """Close the serial port connection"""
         if self.serial_port and self.serial_port.is_open:
@@ -198,7 +462,7 @@ class AtmelHighVoltageParallelProgrammer:
             print("Operation stopped - waiting 5 seconds...")
         time.sleep(5.0)
         self._clear_input_buffer()
-        raise RuntimeError("Operation stopped")
+        raise OperationStoppedError()
 
     def programmer_communicate(
         self,
@@ -217,28 +481,21 @@ class AtmelHighVoltageParallelProgrammer:
         Returns:
             Response string from the programmer
         """
+        simple = self._SIMPLE_COMMANDS.get(cmd)
+        if simple is not None:
+            expected_length, with_parameters = simple
+            return self._send_command(cmd.code, parameters if with_parameters else "", expected_length)
+
         result = ""
 
+        if cmd in self._MEMORY_COMMANDS:
+            # Drop stale input once per operation; pages themselves are checked by CRC
+            self._clear_input_buffer()
+
         if cmd == HVPPCommand.OPEN:
             if DEBUG_PRINT:
-                print(f"Sending command 00{self.chip_id}")
-            result = self._send_command("00", self.chip_id, 0)
-        elif cmd == HVPPCommand.READ_SIGNATURE:
-            result = self._send_command("01", "", 6)
-        elif cmd == HVPPCommand.READ_FUSES:
-            result = self._send_command("02", "", 11)
-        elif cmd == HVPPCommand.WRITE_LFUSE:
-            result = self._send_command("03", parameters, 0)
-        elif cmd == HVPPCommand.WRITE_HFUSE:
-            result = self._send_command("04", parameters, 0)
-        elif cmd == HVPPCommand.WRITE_EXT_FUSE:
-            result = self._send_command("05", parameters, 0)
-        elif cmd == HVPPCommand.WRITE_LOCK_BYTE:
-            result = self._send_command("06", "", 0)
-        elif cmd == HVPPCommand.CHIP_ERASE:
-            result = self._send_command("07", "", 0)
-        elif cmd == HVPPCommand.READ_CALIBRATION_BYTE:
-            result = self._send_command("08", "", 2)
+                print(f"Sending command {cmd.code}{self.chip_id}")
+            result = self._send_command(cmd.code, self.chip_id, 0)
         elif cmd == HVPPCommand.READ_MEMORY:
             # Parameters format: "memory_type:filename" or "memory_type:filename:num_pages"
             # memory_type: "flash" or "eeprom"
@@ -298,13 +555,63 @@ class AtmelHighVoltageParallelProgrammer:
                 result = self._verify_eeprom_memory(filename, progress_callback, stop_event)
             else:
                 raise ValueError(f"Unknown memory type: {memory_type}")
-        elif cmd == HVPPCommand.LOG:
-            result = self._send_command("97", "", 0)
-        elif cmd == HVPPCommand.END:
-            result = self._send_command("99", "", 1)
 
         return result
 
+    def programmer_write_fuses(self, lfuse: str, hfuse: str, efuse: str) -> str:
+        """
+        Write low, high and extended fuses
+
+        Uses a single WRITE_FUSES_BATCH transaction when the firmware supports it,
+        otherwise writes each fuse with its own command.
+
+        Args:
+            lfuse: Low fuse value (hex)
+            hfuse: High fuse value (hex)
+            efuse: Extended fuse value (hex)
+
+        Returns:
+            "0" on success, or the first firmware error response
+        """
+        if self.fuses_batch_supported:
+            return self.programmer_communicate(HVPPCommand.WRITE_FUSES_BATCH, f"L:{lfuse};H:{hfuse};E:{efuse}")
+
+        for cmd, value in (
+            (HVPPCommand.WRITE_LFUSE, lfuse),
+            (HVPPCommand.WRITE_HFUSE, hfuse),
+            (HVPPCommand.WRITE_EXT_FUSE, efuse),
+        ):
+            result = self.programmer_communicate(cmd, value)
+            if result != "0":
+                return result
+        return "0"
+
+    def programmer_set_baud_rate(self, baud_rate: int) -> str:
+        """
+        Switch the programmer and the serial port to another speed
+
+        The firmware answers at the current speed, then changes its UART
+        divisor; the port is reconfigured in place afterwards.
+
+        Args:
+            baud_rate: New speed (bauds)
+
+        Returns:
+            "0" on success, or the firmware error response
+        """
+        if not self.set_baud_supported:
+            if DEBUG_PRINT:
+                print(f"Firmware cannot change speed, staying at {self.serial_port.baudrate} bauds")
+            return "1 Baud rate change not supported by the firmware"
+
+        result = self.programmer_communicate(HVPPCommand.SET_BAUD, f"{baud_rate:06X}")
+        if result == "0":
+            self.serial_port.baudrate = baud_rate
+            self.serial_port.reset_input_buffer()
+            if DEBUG_PRINT:
+                print(f"Link speed set to {baud_rate} bauds")
+        return result
+
     def _send_command(self, cmd: str, data: str, expected_length: int) -> str:
         """
         Send command and wait for response
@@ -340,8 +647,8 @@ class AtmelHighVoltageParallelProgrammer:
         """
         try:
             if self.serial_port and self.serial_port.is_open:
+                # No flush(): the reply to the command is the only synchronisation needed
                 bytes_written = self.serial_port.write(data.encode('utf-8'))
-                self.serial_port.flush()  # Force immediate write
                 if DEBUG_PRINT:
                     print(f'Sending "{data}" ({bytes_written} bytes written)')
             else:
@@ -356,7 +663,6 @@ class AtmelHighVoltageParallelProgrammer:
         try:
             if self.serial_port and self.serial_port.is_open:
                 bytes_written = self.serial_port.write(data)
-                self.serial_port.flush()
                 if DEBUG_PRINT:
                     print(f"Sending {bytes_written} raw bytes")
             else:
@@ -372,17 +678,17 @@ class AtmelHighVoltageParallelProgrammer:
         If response starts with '1 ' (error with message), wait for \r\n regardless of expected_length.
         """
         self.data_received_ready = False
-        self.in_string = ""
+        self._in_buf.clear()
 
         timeout = time.time() + timeout_seconds
-        while not self.data_received_ready and len(self.in_string) < expected_length:
+        while not self.data_received_ready and len(self._in_buf) < expected_length:
             if time.time() > timeout:
                 print("Timeout waiting for response (no data received)")
                 break
             self._read_data()
 
-            time.sleep(0.005)
-
+        if not self.data_received_ready:
+            self.in_string = self._in_buf.decode('utf-8', errors='replace')
         return self.in_string
 
     def _read_response_until_newline(self, timeout_seconds: float = 5.0) -> str:
@@ -392,34 +698,58 @@ class AtmelHighVoltageParallelProgrammer:
         Used when we don't know the size of the response (e.g., error messages).
         """
         self.data_received_ready = False
-        self.in_string = ""
+        in_buf = self._in_buf
+        in_buf.clear()
         timeout = time.time() + timeout_seconds
-        while not self.data_received_ready:
-            if time.time() > timeout:
-                if len(self.in_string) == 0:
-                    self.in_string = "1 Timeout waiting for response (no data received)"
-                    if DEBUG_PRINT:
-                        print("Timeout waiting for response (no data received)")
-                break
-            self._read_data()
-            time.sleep(0.3)
+        try:
+            serial_port = self.serial_port
+            if serial_port and serial_port.is_open:
+                while time.time() <= timeout:
+                    # Returns at the terminator (nothing after it is consumed)
+                    # or after the port timeout (0.1 s)
+                    in_buf += serial_port.read_until(b"\r\n")
+                    if in_buf.endswith(b"\r\n"):
+                        self.in_string = in_buf.replace(b"\0", b"").replace(b"\r\n", b"").decode('utf-8', errors='replace')
+                        self.data_received_ready = True
+                        if DEBUG_PRINT:
+                            print(f"Complete data received: '{self.in_string}'")
+                        break
+        except Exception as ex:
+            if DEBUG_PRINT:
+                print(f"ERROR in _read_response_until_newline: {ex}")
+
+        if not self.data_received_ready:
+            if len(in_buf) == 0:
+                self.in_string = "1 Timeout waiting for response (no data received)"
+                if DEBUG_PRINT:
+                    print("Timeout waiting for response (no data received)")
+            else:
+                self.in_string = in_buf.decode('utf-8', errors='replace')
 
         return self.in_string
 
     def _read_data(self):
-        """Read data from serial port"""
+        """Read data from serial port
+
+        Blocks until at least one byte arrives or the port timeout (0.1 s)
+        elapses, then takes everything already buffered.
+        """
         try:
-            if self.serial_port and self.serial_port.is_open:
-                waiting = self.serial_port.in_waiting
-                if waiting > 0:
-                    in_data = self.serial_port.read(self.serial_port.in_waiting).decode('utf-8', errors='replace')
+            serial_port = self.serial_port
+            if serial_port and serial_port.is_open:
+                in_bytes = serial_port.read(1)
+                if in_bytes:
+                    waiting = serial_port.in_waiting
+                    if waiting > 0:
+                        in_bytes += serial_port.read(waiting)
                     if DEBUG_PRINT:
-                        print(f'Receiving "{in_data}" ({waiting} bytes)')
-                    self.in_string += in_data
+                        print(f'Receiving {in_bytes!r} ({len(in_bytes)} bytes)')
+                    in_buf = self._in_buf
+                    in_buf += in_bytes
 
-                    # Check for end of transmission
-                    if "\r\n" in self.in_string:
-                        self.in_string = self.in_string.replace("\0", "").replace("\r\n", "")
+                    # Check for end of transmission, decode the whole response once
+                    if b"\r\n" in in_buf:
+                        self.in_string = in_buf.replace(b"\0", b"").replace(b"\r\n", b"").decode('utf-8', errors='replace')
                         self.data_received_ready = True
                         if DEBUG_PRINT:
                             print(f"Complete data received: '{self.in_string}'")
@@ -459,11 +789,15 @@ class AtmelHighVoltageParallelProgrammer:
         Raises:
             RuntimeError: If CRC check fails or communication error
         """
-        # Format command: 09sspppptt
-        # ss: page size in hex (2 digits)
-        # pppp: page number in hex (4 digits)
-        # tt: memory type in hex (2 digits)
-        cmd = f"09{page_size:02X}{page_number:04X}{memory_type:02X}"
+        if self.binary_pages_supported:
+            # Binary command: 0x09, page size, page number (big endian, 2 bytes), memory type
+            cmd = struct.pack(">BBHB", 0x09, page_size, page_number, memory_type)
+        else:
+            # Format command: 09sspppptt
+            # ss: page size in hex (2 digits)
+            # pppp: page number in hex (4 digits)
+            # tt: memory type in hex (2 digits)
+            cmd = b"09%02X%04X%02X" % (page_size, page_number, memory_type)
 
         if stop_event and stop_event.is_set():
             self._handle_operation_stop()
@@ -471,25 +805,23 @@ class AtmelHighVoltageParallelProgrammer:
         if DEBUG_PRINT:
             unit = "words" if memory_type == 0x01 else "bytes"
             print(
-                f"Sending memory read command: {cmd} "
+                f"Sending memory read command: {cmd!r} "
                 f"(page_size={page_size} {unit}, page_number={page_number}, memory_type=0x{memory_type:02X})"
             )
 
-        if DEBUG_PRINT:
-            print("Clearing input buffer before read")
-        if self.serial_port and self.serial_port.is_open:
-            self.serial_port.reset_input_buffer()
-
         # Send command
-        self._send_data(cmd)
+        self._send_bytes(cmd)
 
         # Wait for response:
         # Flash: page_size is in words -> 2 bytes per word
         # EEPROM: page_size is in bytes
         data_bytes = page_size * 2 if memory_type == 0x01 else page_size
         expected_bytes = data_bytes + 2
-        data = b''
+        data = bytearray()  # Grown in place as chunks arrive
+        running_crc = 0  # CRC of the page data received so far (trailing CRC bytes excluded)
         timeout = time.time() + 5  # 5 second timeout
+        read = self.serial_port.read
+        crc16_update = self._crc16_update
 
         if DEBUG_PRINT:
             print(f"Waiting for {expected_bytes} bytes (data + CRC)")
@@ -502,29 +834,36 @@ class AtmelHighVoltageParallelProgrammer:
                     print(
                         f"Timeout while waiting for memory data. Received {len(data)}/{expected_bytes} bytes"
                     )
+                # A short reply may be a firmware error line instead of page data
+                if data.startswith(b"1 ") and data.endswith(b"\r\n"):
+                    raise FirmwareResponseError(data[:-2].decode('utf-8', errors='replace'))
                 raise RuntimeError(f"Timeout waiting for memory data. Received {len(data)}/{expected_bytes} bytes")
 
-            if self.serial_port.in_waiting > 0:
-                chunk = self.serial_port.read(self.serial_port.in_waiting)
-                data += chunk
+            # Blocks until the missing bytes arrive, the port timeout (0.1 s)
+            # elapses or signal_stop() cancels the read (on POSIX pyserial
+            # already waits in select() on the port and its cancel pipe,
+            # on Windows in an overlapped read)
+            chunk = read(expected_bytes - len(data))
+            if chunk:
+                missing_data = data_bytes - len(data)
+                if missing_data > 0:
+                    running_crc = crc16_update(running_crc, chunk[:missing_data])
+                data.extend(chunk)
                 if DEBUG_PRINT:
                     print(f"Received {len(chunk)} bytes, total: {len(data)}/{expected_bytes}")
 
-            time.sleep(0.01)
-
         # Extract page data and CRC
-        page_data = data[:data_bytes]
         received_crc = int.from_bytes(data[data_bytes:data_bytes+2], byteorder='little')
+        del data[data_bytes:]
+        page_data = data
 
         if DEBUG_PRINT:
             preview_len = min(16, len(page_data))
-            preview_hex = " ".join(
-                f"{byte_value:02X}" for byte_value in page_data[:preview_len]
-            )
+            preview_hex = page_data[:preview_len].hex(" ").upper()
             print(f"Page data preview ({preview_len} bytes): {preview_hex}")
 
-        # Calculate CRC-16
-        calculated_crc = self._calculate_crc16(page_data)
+        # CRC-16 computed while receiving
+        calculated_crc = running_crc
 
         if DEBUG_PRINT:
             print(f"Received CRC: 0x{received_crc:04X}, Calculated CRC: 0x{calculated_crc:04X}")
@@ -539,124 +878,132 @@ class AtmelHighVoltageParallelProgrammer:
         """
         Calculate CRC-16 (CCITT) checksum
 
+        Same algorithm as the firmware (polynomial 0x1021, initial value 0,
+        a.k.a. CRC-16/XMODEM), computed by binascii's C implementation
+        (256-entry table, one lookup per byte).
+
         Args:
             data: Data bytes to calculate CRC for
 
         Returns:
             CRC-16 value
         """
-        crc = 0
-
-        for byte in data:
-            crc ^= byte << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ 0x1021
-                else:
-                    crc = crc << 1
-                crc &= 0xFFFF
+        return binascii.crc_hqx(data, 0)
 
-        return crc
+    @staticmethod
+    def _crc16_update(crc: int, data: bytes) -> int:
+        """Continue a CRC-16 (same algorithm as _calculate_crc16) over more data"""
+        return binascii.crc_hqx(data, crc)
 
     @staticmethod
-    def _parse_intel_hex(filename: str) -> dict[int, int]:
-        """Parse Intel HEX file into a memory map (address -> byte)."""
-        memory: dict[int, int] = {}
-        upper = 0
+    def _parse_intel_hex(filename: str, size: int, memory_label: str) -> tuple[bytearray, bytearray]:
+        """Parse Intel HEX file into a memory image of size bytes.
 
-        with open(filename, "r") as f:
-            for line_num, line in enumerate(f, start=1):
-                line = line.strip()
-                if not line:
-                    continue
-                if not line.startswith(":"):
-                    raise ValueError(f"Invalid HEX line {line_num}: missing ':'")
-
-                raw = line[1:]
-                if len(raw) < 10:
-                    raise ValueError(f"Invalid HEX line {line_num}: too short")
-
-                byte_count = int(raw[0:2], 16)
-                addr = int(raw[2:6], 16)
-                record_type = int(raw[6:8], 16)
-                expected_len = 8 + byte_count * 2 + 2
-                if len(raw) != expected_len:
-                    raise ValueError(
-                        f"Invalid HEX line {line_num}: length {len(raw)} does not match expected {expected_len}"
-                    )
-                data_str = raw[8:8 + byte_count * 2]
-                checksum = int(raw[8 + byte_count * 2:8 + byte_count * 2 + 2], 16)
-
-                # Calcule du checksum pour contrôler l'intégrité de la ligne
-                calc = byte_count + ((addr >> 8) & 0xFF) + (addr & 0xFF) + record_type
-                data_bytes = bytes.fromhex(data_str) if data_str else b""
-                for byte_value in data_bytes:
-                    calc += byte_value
-                calc = (0x100 - (calc & 0xFF)) & 0xFF
-
-                if calc != checksum:
-                    raise ValueError(f"HEX checksum error on line {line_num}")
-
-                match record_type:
-                    case 0x00:
-                        base_address = upper + addr
-                        for byte_index, byte_value in enumerate(data_bytes):
-                            memory[base_address + byte_index] = byte_value
-                    case 0x01:
-                        break
-                    case 0x04:
-                        if byte_count != 2:
-                            raise ValueError(
-                                f"Invalid extended linear address record at line {line_num}"
-                            )
-                        upper = int(data_str, 16) << 16
-                    case 0x02:
-                        if byte_count != 2:
-                            raise ValueError(
-                                f"Invalid extended segment address record at line {line_num}"
-                            )
-                        upper = int(data_str, 16) << 4
-                    case _:
-                        # Ignore other record types
+        Args:
+            filename: HEX file path
+            size: Memory size in bytes
+            memory_label: Memory name for error messages ("Flash" or "EEPROM")
+
+        Returns:
+            (data, present): data holds the bytes of the file (0xFF elsewhere),
+            present is 1 at each address defined by the file, 0 elsewhere
+
+        Raises:
+            ValueError: If a line is malformed
+            RuntimeError: If the file has data outside the memory size
+        """
+        data = bytearray(b"\xFF") * size
+        present = bytearray(size)
+        upper = 0
+        first_outside: Optional[int] = None  # Lowest address beyond the memory size
+
+        # Whole file read at once and scanned as bytes (no per-line decoding)
+        with open(filename, "rb") as f:
+            content = f.read()
+
+        for line_num, line in enumerate(content.split(b"\n"), start=1):
+            line = line.strip()
+            if not line:
+                continue
+            if not line.startswith(b":"):
+                raise ValueError(f"Invalid HEX line {line_num}: missing ':'")
+
+            raw = line[1:]
+            if len(raw) < 10:
+                raise ValueError(f"Invalid HEX line {line_num}: too short")
+
+            byte_count = int(raw[0:2], 16)
+            expected_len = 8 + byte_count * 2 + 2
+            if len(raw) != expected_len:
+                raise ValueError(
+                    f"Invalid HEX line {line_num}: length {len(raw)} does not match expected {expected_len}"
+                )
+
+            # Fixed layout: count(1) address(2) type(1) data(count) checksum(1)
+            record = binascii.unhexlify(raw)
+            addr = (record[1] << 8) | record[2]
+            record_type = record[3]
+            data_bytes = record[4:-1]
+
+            # The checksum makes the sum of all record bytes a multiple of 256
+            if sum(record) & 0xFF:
+                raise ValueError(f"HEX checksum error on line {line_num}")
+
+            match record_type:
+                case 0x00:
+                    base_address = upper + addr
+                    end_address = base_address + byte_count
+                    if end_address > size:
+                        # Reported once the whole file has been checked
+                        outside = max(base_address, size)
+                        if first_outside is None or outside < first_outside:
+                            first_outside = outside
                         continue
+                    data[base_address:end_address] = data_bytes
+                    present[base_address:end_address] = b"\x01" * byte_count
+                case 0x01:
+                    break
+                case 0x04:
+                    if byte_count != 2:
+                        raise ValueError(
+                            f"Invalid extended linear address record at line {line_num}"
+                        )
+                    upper = int.from_bytes(data_bytes, "big") << 16
+                case 0x02:
+                    if byte_count != 2:
+                        raise ValueError(
+                            f"Invalid extended segment address record at line {line_num}"
+                        )
+                    upper = int.from_bytes(data_bytes, "big") << 4
+                case _:
+                    # Ignore other record types
+                    continue
 
-        return memory
+        if first_outside is not None:
+            raise RuntimeError(
+                f"HEX data contains address outside {memory_label} memory size: 0x{first_outside:06X}"
+            )
+
+        return data, present
 
     @staticmethod
-    def _segment_page_data(page_bytes: int, offsets: list[int], values: dict[int, int]) -> list[tuple[int, bytes]]:
-        """Build contiguous segments (offset, data) for a page."""
-        segments: list[tuple[int, bytes]] = []
-        if not offsets:
-            return segments
+    def _segment_page_data(page_data: bytes, page_present: bytes) -> list[tuple[int, bytes]]:
+        """Build contiguous segments (offset, data) for a page.
 
-        offsets.sort()
-        start = offsets[0]
-        current = [values[start]]
-        prev = start
+        Args:
+            page_data: Page slice of the memory image
+            page_present: Matching slice of the presence mask (1: byte defined by the HEX file)
+        """
+        segments: list[tuple[int, bytes]] = []
+        start = page_present.find(1)
+        while start != -1:
+            end = page_present.find(0, start)
+            if end == -1:
+                end = len(page_present)
+            segments.append((start, page_data[start:end]))
+            start = page_present.find(1, end)
 
-        for off in offsets[1:]:
-            if off == prev + 1:
-                current.append(values[off])
-            else:
-                segments.append((start, bytes(current)))
-                start = off
-                current = [values[off]]
-            prev = off
-
-        segments.append((start, bytes(current)))
-
-        # Split segments if they exceed page boundary
-        split_segments: list[tuple[int, bytes]] = []
-        for start, data in segments:
-            offset_index = 0
-            while offset_index < len(data):
-                current_offset = start + offset_index
-                max_chunk_size = page_bytes - current_offset
-                chunk = data[offset_index:offset_index + max_chunk_size]
-                split_segments.append((current_offset, chunk))
-                offset_index += len(chunk)
-
-        return split_segments
+        return segments
 
     def _read_flash_memory(
         self,
@@ -675,8 +1022,8 @@ class AtmelHighVoltageParallelProgrammer:
         Raises:
             RuntimeError: If read fails or CRC check fails
         """
-        page_size = self.chip_props["flash_page_size"]
-        total_size = self.chip_props["flash_total_size"]
+        page_size = self.flash_page_size
+        total_size = self.flash_total_size
         total_pages = total_size // (page_size * 2)
 
         # Use specified number of pages or default to all pages
@@ -689,26 +1036,25 @@ class AtmelHighVoltageParallelProgrammer:
                 f"total_size={total_size} bytes, output='{filename}'"
             )
 
-        # Read specified number of pages
+        # Read specified number of pages, each one is written to the Intel HEX file as it arrives
         if progress_callback:
             progress_callback(0, pages_to_read)
-        all_data = bytearray()
-        for page_num in range(pages_to_read):
-            if stop_event and stop_event.is_set():
-                self._handle_operation_stop()
-            page_data = self._read_memory_page(page_size, page_num, 0x01, stop_event)  # 0x01 = Flash
-            all_data.extend(page_data)
-
-            if progress_callback:
-                progress_callback(page_num + 1, pages_to_read)
-
-            if DEBUG_PRINT:
-                print(f"Read Flash page {page_num + 1}/{pages_to_read}")
-
-        # Write to Intel HEX file
         if DEBUG_PRINT:
             print(f"Writing Flash data to Intel HEX file: '{filename}'")
-        self._write_intel_hex(filename, all_data)
+        read_page = self._read_memory_page
+        with self._open_hex_output(filename) as hex_writer:
+            write_hex = hex_writer.write
+            for page_num in range(pages_to_read):
+                if stop_event and stop_event.is_set():
+                    self._handle_operation_stop()
+                page_data = read_page(page_size, page_num, 0x01, stop_event)  # 0x01 = Flash
+                write_hex(page_data)
+
+                if progress_callback:
+                    progress_callback(page_num + 1, pages_to_read)
+
+                if DEBUG_PRINT:
+                    print(f"Read Flash page {page_num + 1}/{pages_to_read}")
         if DEBUG_PRINT:
             print("Flash read completed successfully")
 
@@ -729,8 +1075,8 @@ class AtmelHighVoltageParallelProgrammer:
         Raises:
             RuntimeError: If read fails or CRC check fails
         """
-        page_size = self.chip_props["eeprom_page_size"]
-        total_size = self.chip_props["eeprom_total_size"]
+        page_size = self.eeprom_page_size
+        total_size = self.eeprom_total_size
         total_pages = total_size // page_size
 
         # Use specified number of pages or default to all pages
@@ -743,32 +1089,32 @@ class AtmelHighVoltageParallelProgrammer:
                 f"total_size={total_size}, output='{filename}'"
             )
 
-        # Read specified number of pages
+        # Read specified number of pages, each one is written to the Intel HEX file as it arrives
         if progress_callback:
             progress_callback(0, pages_to_read)
-        all_data = bytearray()
-        for page_num in range(pages_to_read):
-            if stop_event and stop_event.is_set():
-                self._handle_operation_stop()
-            page_data = self._read_memory_page(page_size, page_num, 0x02, stop_event)  # 0x02 = EEPROM
-            all_data.extend(page_data)
-
-            if progress_callback:
-                progress_callback(page_num + 1, pages_to_read)
-
-            if DEBUG_PRINT:
-                print(f"Read EEPROM page {page_num + 1}/{pages_to_read}")
-
-        # Write to Intel HEX file
         if DEBUG_PRINT:
             print(f"Writing EEPROM data to Intel HEX file: '{filename}'")
-        self._write_intel_hex(filename, all_data)
+        read_page = self._read_memory_page
+        with self._open_hex_output(filename) as hex_writer:
+            write_hex = hex_writer.write
+            for page_num in range(pages_to_read):
+                if stop_event and stop_event.is_set():
+                    self._handle_operation_stop()
+                page_data = read_page(page_size, page_num, 0x02, stop_event)  # 0x02 = EEPROM
+                write_hex(page_data)
+
+                if progress_callback:
+                    progress_callback(page_num + 1, pages_to_read)
+
+                if DEBUG_PRINT:
+                    print(f"Read EEPROM page {page_num + 1}/{pages_to_read}")
         if DEBUG_PRINT:
             print("EEPROM read completed successfully")
 
     def _verify_memory(
         self,
         filename: str,
+        total_size: int,
         page_size: int,
         page_bytes: int,
         memory_type: int,
@@ -781,6 +1127,7 @@ class AtmelHighVoltageParallelProgrammer:
 
         Args:
             filename: HEX file path to compare against
+            total_size: Memory size in bytes
             page_size: Page size (in units - words for Flash, bytes for EEPROM)
             page_bytes: Page size in bytes
             memory_type: Memory type (0x01 for Flash, 0x02 for EEPROM)
@@ -795,14 +1142,13 @@ class AtmelHighVoltageParallelProgrammer:
             print(f"Verifying {memory_label} from file: '{filename}'")
 
         # Parse HEX file to get expected data
-        expected_memory = self._parse_intel_hex(filename)
-        if not expected_memory:
+        expected, present = self._parse_intel_hex(filename, total_size, memory_label)
+        min_addr = present.find(1)
+        if min_addr == -1:
             return "1 HEX file contains no data"
 
         # Determine which pages need to be read
-        addresses = list(expected_memory.keys())
-        min_addr = min(addresses)
-        max_addr = max(addresses)
+        max_addr = present.rfind(1)
 
         first_page = min_addr // page_bytes
         last_page = max_addr // page_bytes
@@ -816,26 +1162,30 @@ class AtmelHighVoltageParallelProgrammer:
 
         # Read and verify each page
         mismatches = []
+        read_page = self._read_memory_page
         for page_index, page_num in enumerate(range(first_page, last_page + 1)):
             if stop_event and stop_event.is_set():
                 self._handle_operation_stop()
 
             # Read page from microcontroller
-            page_data = self._read_memory_page(page_size, page_num, memory_type, stop_event)
+            page_data = read_page(page_size, page_num, memory_type, stop_event)
 
             # Verify bytes that are defined in the HEX file
+            # (whole page compared at once, byte by byte only if it differs)
             page_start_addr = page_num * page_bytes
-            for offset in range(len(page_data)):
-                addr = page_start_addr + offset
-                if addr in expected_memory:
-                    expected_byte = expected_memory[addr]
-                    actual_byte = page_data[offset]
-                    if expected_byte != actual_byte:
-                        mismatches.append(
-                            f"0x{addr:06X}: expected 0x{expected_byte:02X}, got 0x{actual_byte:02X}"
-                        )
-                        if len(mismatches) >= 10:  # Limit error reporting
-                            break
+            page_end_addr = page_start_addr + len(page_data)
+            if expected[page_start_addr:page_end_addr] != page_data:
+                for offset in range(len(page_data)):
+                    addr = page_start_addr + offset
+                    if present[addr]:
+                        expected_byte = expected[addr]
+                        actual_byte = page_data[offset]
+                        if expected_byte != actual_byte:
+                            mismatches.append(
+                                f"0x{addr:06X}: expected 0x{expected_byte:02X}, got 0x{actual_byte:02X}"
+                            )
+                            if len(mismatches) >= 10:  # Limit error reporting
+                                break
 
             if progress_callback:
                 progress_callback(page_index + 1, total_pages)
@@ -873,11 +1223,12 @@ class AtmelHighVoltageParallelProgrammer:
         Returns:
             "0" on success, error message on verification failure
         """
-        page_size = self.chip_props["flash_page_size"]
+        page_size = self.flash_page_size
         page_bytes = page_size * 2  # Flash is in words (2 bytes each)
 
         return self._verify_memory(
             filename=filename,
+            total_size=self.flash_total_size,
             page_size=page_size,
             page_bytes=page_bytes,
             memory_type=0x01,  # Flash
@@ -901,11 +1252,12 @@ class AtmelHighVoltageParallelProgrammer:
         Returns:
             "0" on success, error message on verification failure
         """
-        page_size = self.chip_props["eeprom_page_size"]
+        page_size = self.eeprom_page_size
         page_bytes = page_size  # EEPROM is in bytes
 
         return self._verify_memory(
             filename=filename,
+            total_size=self.eeprom_total_size,
             page_size=page_size,
             page_bytes=page_bytes,
             memory_type=0x02,  # EEPROM
@@ -925,8 +1277,8 @@ class AtmelHighVoltageParallelProgrammer:
         Returns:
             "0" on success, or firmware error response
         """
-        page_words = self.chip_props["flash_page_size"]
-        total_size = self.chip_props["flash_total_size"]
+        page_words = self.flash_page_size
+        total_size = self.flash_total_size
         return self._write_memory_from_hex(
             filename=filename,
             total_size=total_size,
@@ -948,8 +1300,8 @@ class AtmelHighVoltageParallelProgrammer:
         Returns:
             "0" on success, or firmware error response
         """
-        page_bytes = self.chip_props["eeprom_page_size"]
-        total_size = self.chip_props["eeprom_total_size"]
+        page_bytes = self.eeprom_page_size
+        total_size = self.eeprom_total_size
         return self._write_memory_from_hex(
             filename=filename,
             total_size=total_size,
@@ -984,34 +1336,34 @@ class AtmelHighVoltageParallelProgrammer:
                 f"total_size={total_size} bytes, input='{filename}'"
             )
 
-        memory = self._parse_intel_hex(filename)
-        if not memory:
+        # Out of range data is reported by the parser
+        image, present = self._parse_intel_hex(filename, total_size, memory_label)
+        min_addr = present.find(1)
+        if min_addr == -1:
             raise RuntimeError("HEX file contains no data")
 
-        out_of_range = [addr for addr in memory if addr < 0 or addr >= total_size]
-        if out_of_range:
-            first_addr = min(out_of_range)
-            raise RuntimeError(
-                f"HEX data contains address outside {memory_label} memory size: 0x{first_addr:06X}"
-            )
-
-        pages: dict[int, dict[int, int]] = {}
-        for addr, value in memory.items():
-            page_number = addr // page_bytes
-            offset = addr % page_bytes
-            pages.setdefault(page_number, {})[offset] = value
+        # Pages holding at least one byte of the file
+        pages = [
+            page_number
+            for page_number in range(min_addr // page_bytes, present.rfind(1) // page_bytes + 1)
+            if present.find(1, page_number * page_bytes, (page_number + 1) * page_bytes) != -1
+        ]
 
         total_pages = len(pages)
         if progress_callback:
             progress_callback(0, total_pages)
 
-        for page_index, (page_number, values) in enumerate(sorted(pages.items())):
+        segment_page_data = self._segment_page_data
+        write_page = self._write_memory_page
+        for page_index, page_number in enumerate(pages):
             if stop_event and stop_event.is_set():
                 self._handle_operation_stop()
 
-            segments = self._segment_page_data(page_bytes, list(values.keys()), values)
+            page_start = page_number * page_bytes
+            page_end = page_start + page_bytes
+            segments = segment_page_data(image[page_start:page_end], present[page_start:page_end])
             for offset, data in segments:
-                response = self._write_memory_page(page_size, page_number, memory_type, offset, data)
+                response = write_page(page_size, page_number, memory_type, offset, data)
                 # Check response for each segment write
                 if response != "0":
                     # Return first error encountered
@@ -1068,16 +1420,22 @@ class AtmelHighVoltageParallelProgrammer:
         if firmware_offset > 0xFF or write_length > 0xFF:
             raise RuntimeError("Offset/length must fit in one byte")
 
-        cmd = f"10{page_size:02X}{page_number:04X}{memory_type:02X}{firmware_offset:02X}{write_length:02X}"
+        if self.binary_pages_supported:
+            # Binary command: 0x0A, page size, page number (big endian, 2 bytes), memory type, offset, length
+            cmd = struct.pack(
+                ">BBHBBB", 0x0A, page_size, page_number, memory_type, firmware_offset, write_length
+            )
+        else:
+            cmd = b"10%02X%04X%02X%02X%02X" % (page_size, page_number, memory_type, firmware_offset, write_length)
 
         if DEBUG_PRINT:
             unit = "words" if memory_type == 0x01 else "bytes"
             print(
-                f"Writing memory page: cmd={cmd} (page_size={page_size} {unit}, page={page_number}, "
+                f"Writing memory page: cmd={cmd!r} (page_size={page_size} {unit}, page={page_number}, "
                 f"offset={offset} bytes -> {firmware_offset} {unit}, length={write_length} {unit}, data_bytes={len(data)})"
             )
 
-        self._send_data(cmd)
+        self._send_bytes(cmd)
 
         # Wait for firmware acknowledgment "+" before sending data
         ack = self._read_response_until_newline(timeout_seconds=5.0)
@@ -1095,7 +1453,7 @@ class AtmelHighVoltageParallelProgrammer:
         # Firmware is ready, send data and CRC
         if DEBUG_PRINT:
             preview_len = min(16, len(data))
-            preview_hex = " ".join(f"{b:02X}" for b in data[:preview_len])
+            preview_hex = data[:preview_len].hex(" ").upper()
             print(f"Sending data ({len(data)} bytes), preview: {preview_hex}")
 
         self._send_bytes(data)
@@ -1117,53 +1475,22 @@ class AtmelHighVoltageParallelProgrammer:
         return response
 
     @staticmethod
-    def _write_intel_hex(filename: str, data: bytearray) -> None:
+    @contextlib.contextmanager
+    def _open_hex_output(filename: str) -> Iterator[_IntelHexWriter]:
         """
-        Write data to Intel HEX format file
+        Intel HEX writer on a temporary file renamed to filename once complete
 
-        Args:
-            filename: Output file path
-            data: Binary data to write
+        If the operation fails or is stopped, the temporary file is removed and
+        an existing output file is left unchanged.
         """
-        with open(filename, 'w') as f:
-            bytes_per_line = 16
-            extended_address = 0
-
-            # Process data in chunks
-            for offset in range(0, len(data), bytes_per_line):
-                # Calculate current extended address (upper 16 bits)
-                current_extended = (offset >> 16) & 0xFFFF
-
-                # Write Extended Linear Address record if needed (for addresses > 64KB)
-                if current_extended != extended_address:
-                    extended_address = current_extended
-                    # Format: :02000004XXXXCC
-                    # 02 = byte count, 0000 = address, 04 = record type (extended linear address)
-                    ext_addr_high = (extended_address >> 8) & 0xFF
-                    ext_addr_low = extended_address & 0xFF
-                    checksum = (0x02 + 0x00 + 0x00 + 0x04 + ext_addr_high + ext_addr_low) & 0xFF
-                    checksum = (0x100 - checksum) & 0xFF
-                    f.write(f":02000004{extended_address:04X}{checksum:02X}\n")
-
-                # Get chunk of data
-                chunk = data[offset:offset + bytes_per_line]
-                byte_count = len(chunk)
-
-                # Calculate address (lower 16 bits)
-                address = offset & 0xFFFF
-
-                # Record type: 00 = data
-                record_type = 0x00
-
-                # Calculate checksum
-                checksum = byte_count + ((address >> 8) & 0xFF) + (address & 0xFF) + record_type
-                for byte in chunk:
-                    checksum += byte
-                checksum = (0x100 - (checksum & 0xFF)) & 0xFF
-
-                # Write data record
-                hex_data = ''.join(f'{byte:02X}' for byte in chunk)
-                f.write(f":{byte_count:02X}{address:04X}{record_type:02X}{hex_data}{checksum:02X}\n")
-
-            # Write End Of File record
-            f.write(":00000001FF\n")
+        tmp_filename = f"{filename}.tmp"
+        try:
+            with open(tmp_filename, "wb") as f:
+                hex_writer = _IntelHexWriter(f)
+                yield hex_writer
+                hex_writer.close()
+            os.replace(tmp_filename, filename)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_filename)
+            raise